@@ -1,30 +1,173 @@
 """
 Enhanced anonymization system for feedback data
 """
+import base64
+import calendar
 import hashlib
+import hmac
+import os
 import secrets
-import uuid
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Anonymous IDs are "anon_" + 16 hex chars of SHA-256; the value is the key of the
+# unique index on feedback_submissions.anonymous_id, so the scheme must stay stable
+ANON_ID_PREFIX = "anon_"
+ANON_ID_LENGTH = len(ANON_ID_PREFIX) + 16
+_SALT_SUFFIX = b"_anonymous_salt"
+
+def _anon_salt(student_id: str, semester: str, academic_year: str) -> bytes:
+    """Build the anonymous-ID salt as bytes without an intermediate str"""
+    return b"_".join((student_id.encode(), semester.encode(), academic_year.encode())) + _SALT_SUFFIX
+
+# Fields kept by anonymize_feedback_data; anything else (including identifying
+# fields added to the payload later) is dropped
+_ALLOWED_ANON_KEYS = (
+    'anonymous_id', 'student_section', 'semester', 'academic_year',
+    'faculty_feedbacks', 'is_anonymous', 'submitted_at', 'session_token',
+    'privacy_level'
+)
+_ALLOWED_ANON_KEY_SET = frozenset(_ALLOWED_ANON_KEYS)
+
+# Read-only default retention policy, shared by every retention check
+_DEFAULT_POLICY = MappingProxyType({
+    'feedback_submissions': MappingProxyType({
+        'retention_period_days': 2555,  # 7 years
+        'anonymization_after_days': 365,  # 1 year
+        'deletion_after_days': 2555,  # 7 years
+        'archive_before_deletion': True
+    }),
+    'feedback_drafts': MappingProxyType({
+        'retention_period_days': 90,  # 3 months
+        'auto_delete_after_days': 90,
+        'archive_before_deletion': False
+    }),
+    'audit_logs': MappingProxyType({
+        'retention_period_days': 2555,  # 7 years
+        'anonymization_after_days': 1095,  # 3 years
+        'deletion_after_days': 2555,  # 7 years
+        'archive_before_deletion': True
+    })
+})
+
+# Static parts of generate_privacy_report; None fields are filled in per report
+_PRIVACY_REPORT_TEMPLATE: Mapping[str, Any] = MappingProxyType({
+    'report_type': 'privacy_compliance',
+    'data_type': None,
+    'time_period_days': None,
+    'generated_at': None,
+    'cutoff_date': None,
+    'metrics': None,
+    'compliance_status': 'compliant',  # Would be calculated based on metrics
+    'recommendations': (
+        'Review data retention policies quarterly',
+        'Implement automated anonymization processes',
+        'Regular privacy impact assessments'
+    )
+})
+_EMPTY_PRIVACY_METRICS = MappingProxyType({
+    'total_records': 0,  # Would be populated from database
+    'anonymized_records': 0,
+    'deleted_records': 0,
+    'pending_anonymization': 0,
+    'pending_deletion': 0
+})
+
+SECONDS_PER_DAY = 86400
+
+def _epoch_seconds(value: Union[datetime, int]) -> int:
+    """Convert a timestamp to epoch seconds; naive datetimes are taken as UTC"""
+    if isinstance(value, int):
+        return value
+    if value.tzinfo is None:
+        return calendar.timegm(value.timetuple())
+    return int(value.timestamp())
+
+@dataclass(frozen=True)
+class RetentionRow:
+    """Minimal view of a stored record for retention sweeps"""
+    __slots__ = ('data_type', 'created_at_epoch_s', 'id')
+    
+    data_type: str
+    created_at_epoch_s: int
+    id: str
+    
+    @classmethod
+    def from_document(cls, data_type: str, document: Dict[str, Any]) -> 'RetentionRow':
+        """Build a row from a database document, converting created_at once"""
+        return cls(
+            data_type=data_type,
+            created_at_epoch_s=_epoch_seconds(document['created_at']),
+            id=str(document.get('id') or document['_id'])
+        )
+
+# Session tokens are carved out of a per-thread pool of random bytes so a burst of
+# submissions costs one getrandom() call per 128 tokens instead of one per token
+_TOKEN_BYTES = 32
+_TOKEN_POOL_SIZE = _TOKEN_BYTES * 128
+_token_pool = threading.local()
+
+def _reset_token_pool() -> None:
+    """Discard pooled random bytes so a forked worker never reuses its parent's"""
+    global _token_pool
+    _token_pool = threading.local()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_token_pool)
+
+def _pooled_random_bytes(size: int) -> bytes:
+    """Take the next `size` unused bytes from this thread's random pool"""
+    pool = _token_pool
+    buffer = getattr(pool, 'buffer', b'')
+    offset = getattr(pool, 'offset', 0)
+    if offset + size > len(buffer):
+        buffer = pool.buffer = os.urandom(_TOKEN_POOL_SIZE)
+        offset = 0
+    pool.offset = offset + size
+    return buffer[offset:offset + size]
+
+@lru_cache(maxsize=65536)
+def _raw_anon_digest(student_id: str, semester: str, academic_year: str) -> bytes:
+    """The 8 SHA-256 bytes behind an anonymous ID"""
+    # hashlib is backed by OpenSSL, which already dispatches to the SHA-NI
+    # instructions where available
+    salt = _anon_salt(student_id, semester, academic_year)
+    return hashlib.sha256(salt).digest()[:8]
+
+def _stored_anon_digest(anonymous_id: str) -> Optional[bytes]:
+    """Decode a stored anonymous ID back to its digest bytes, or None if malformed"""
+    if len(anonymous_id) != ANON_ID_LENGTH or not anonymous_id.startswith(ANON_ID_PREFIX):
+        return None
+    try:
+        return bytes.fromhex(anonymous_id[len(ANON_ID_PREFIX):])
+    except ValueError:
+        return None
+
+def generate_anonymous_id(student_id: str, semester: str, academic_year: str) -> str:
+    """Generate a consistent anonymous ID for a student in a specific semester"""
+    # Create a deterministic but anonymous identifier
+    anonymous_id = _raw_anon_digest(student_id, semester, academic_year).hex()
+    return f"{ANON_ID_PREFIX}{anonymous_id}"
+
 class AnonymizationService:
     """Service for handling data anonymization and privacy protection"""
     
-    @staticmethod
-    def generate_anonymous_id(student_id: str, semester: str, academic_year: str) -> str:
-        """Generate a consistent anonymous ID for a student in a specific semester"""
-        # Create a deterministic but anonymous identifier
-        salt = f"{student_id}_{semester}_{academic_year}_anonymous_salt"
-        anonymous_id = hashlib.sha256(salt.encode()).hexdigest()[:16]
-        return f"anon_{anonymous_id}"
+    # Module-level so the digest behind it can be memoized
+    generate_anonymous_id = staticmethod(generate_anonymous_id)
     
     @staticmethod
     def generate_session_token() -> str:
         """Generate a secure session token for anonymous sessions"""
-        return secrets.token_urlsafe(32)
+        raw = _pooled_random_bytes(_TOKEN_BYTES)
+        return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
     
     @staticmethod
     def anonymize_feedback_data(feedback_data: Dict[str, Any], is_anonymous: bool = True) -> Dict[str, Any]:
@@ -32,32 +175,39 @@ class AnonymizationService:
         if not is_anonymous:
             return feedback_data
         
-        anonymized = feedback_data.copy()
+        # Already-clean payloads (nothing to drop, no ID to rehash) are returned as-is
+        if 'anonymous_id' not in feedback_data and feedback_data.keys() <= _ALLOWED_ANON_KEY_SET:
+            return feedback_data
         
-        # Remove direct student identification
-        if 'student_id' in anonymized:
-            del anonymized['student_id']
+        anonymized = {
+            key: feedback_data[key] for key in _ALLOWED_ANON_KEYS if key in feedback_data
+        }
         
         # Hash the anonymous ID for consistency
         if 'anonymous_id' in anonymized:
             anonymized['anonymous_id'] = AnonymizationService.generate_anonymous_id(
-                anonymized.get('student_id', 'unknown'),
-                anonymized.get('semester', 'unknown'),
-                anonymized.get('academic_year', 'unknown')
+                feedback_data.get('student_id', 'unknown'),
+                feedback_data.get('semester', 'unknown'),
+                feedback_data.get('academic_year', 'unknown')
             )
         
-        # Remove any other potentially identifying information
-        identifying_fields = [
-            'student_name', 'student_email', 'student_phone',
-            'ip_address', 'user_agent', 'session_id'
-        ]
-        
-        for field in identifying_fields:
-            if field in anonymized:
-                del anonymized[field]
-        
         return anonymized
     
+    @staticmethod
+    def anonymize_batch(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Anonymize many stored feedback rows, e.g. those past their anonymization date"""
+        anonymized_rows = []
+        for row in rows:
+            anonymized = {key: row[key] for key in _ALLOWED_ANON_KEYS if key in row}
+            if 'student_id' in row:
+                anonymized['anonymous_id'] = generate_anonymous_id(
+                    row['student_id'],
+                    row.get('semester', 'unknown'),
+                    row.get('academic_year', 'unknown')
+                )
+            anonymized_rows.append(anonymized)
+        return anonymized_rows
+    
     @staticmethod
     def create_anonymous_submission(
         student_id: str,
@@ -92,10 +242,28 @@ class AnonymizationService:
         academic_year: str
     ) -> bool:
         """Verify that an anonymous ID is consistent with the expected student data"""
-        expected_anonymous_id = AnonymizationService.generate_anonymous_id(
-            student_id, semester, academic_year
-        )
-        return anonymous_id == expected_anonymous_id
+        # Reject IDs that are not in the current format without hashing
+        stored_digest = _stored_anon_digest(anonymous_id)
+        if stored_digest is None:
+            return False
+        expected_digest = _raw_anon_digest(student_id, semester, academic_year)
+        return hmac.compare_digest(stored_digest, expected_digest)
+    
+    @staticmethod
+    def verify_anonymity_consistency_batch(
+        records: List[Tuple[str, str, str, str]]
+    ) -> List[bool]:
+        """Verify many (anonymous_id, student_id, semester, academic_year) records at once"""
+        results = []
+        for anonymous_id, student_id, semester, academic_year in records:
+            stored_digest = _stored_anon_digest(anonymous_id)
+            if stored_digest is None:
+                results.append(False)
+                continue
+            results.append(hmac.compare_digest(
+                stored_digest, _raw_anon_digest(student_id, semester, academic_year)
+            ))
+        return results
     
     @staticmethod
     def create_privacy_audit_log(
@@ -112,45 +280,28 @@ class AnonymizationService:
             'user_type': user_type,
             'data_type': data_type,
             'privacy_level': privacy_level,
-            'session_id': str(uuid.uuid4()),
+            'session_id': secrets.token_hex(16),
             'additional_info': additional_info or {}
         }
         
-        logger.info(f"Privacy audit: {action} - {user_type} - {data_type} - {privacy_level}")
+        logger.info("Privacy audit: %s - %s - %s - %s", action, user_type, data_type, privacy_level)
         return audit_entry
     
     @staticmethod
     def generate_data_retention_policy() -> Dict[str, Any]:
-        """Generate data retention policy configuration"""
-        return {
-            'feedback_submissions': {
-                'retention_period_days': 2555,  # 7 years
-                'anonymization_after_days': 365,  # 1 year
-                'deletion_after_days': 2555,  # 7 years
-                'archive_before_deletion': True
-            },
-            'feedback_drafts': {
-                'retention_period_days': 90,  # 3 months
-                'auto_delete_after_days': 90,
-                'archive_before_deletion': False
-            },
-            'audit_logs': {
-                'retention_period_days': 2555,  # 7 years
-                'anonymization_after_days': 1095,  # 3 years
-                'deletion_after_days': 2555,  # 7 years
-                'archive_before_deletion': True
-            }
-        }
+        """Generate data retention policy configuration (a mutable copy of the default)"""
+        return {data_type: dict(config) for data_type, config in _DEFAULT_POLICY.items()}
     
     @staticmethod
     def should_anonymize_data(
         data_type: str,
-        created_at: datetime,
-        policy: Optional[Dict[str, Any]] = None
+        created_at: Union[datetime, int],
+        policy: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        now_epoch_s: Optional[int] = None
     ) -> bool:
         """Check if data should be anonymized based on retention policy"""
         if policy is None:
-            policy = AnonymizationService.generate_data_retention_policy()
+            policy = _DEFAULT_POLICY
         
         if data_type not in policy:
             return False
@@ -159,18 +310,21 @@ class AnonymizationService:
         if anonymization_days <= 0:
             return False
         
-        days_since_creation = (datetime.utcnow() - created_at).days
+        if now_epoch_s is None:
+            now_epoch_s = int(time.time())
+        days_since_creation = (now_epoch_s - _epoch_seconds(created_at)) // SECONDS_PER_DAY
         return days_since_creation >= anonymization_days
     
     @staticmethod
     def should_delete_data(
         data_type: str,
-        created_at: datetime,
-        policy: Optional[Dict[str, Any]] = None
+        created_at: Union[datetime, int],
+        policy: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        now_epoch_s: Optional[int] = None
     ) -> bool:
         """Check if data should be deleted based on retention policy"""
         if policy is None:
-            policy = AnonymizationService.generate_data_retention_policy()
+            policy = _DEFAULT_POLICY
         
         if data_type not in policy:
             return False
@@ -179,9 +333,65 @@ class AnonymizationService:
         if deletion_days <= 0:
             return False
         
-        days_since_creation = (datetime.utcnow() - created_at).days
+        if now_epoch_s is None:
+            now_epoch_s = int(time.time())
+        days_since_creation = (now_epoch_s - _epoch_seconds(created_at)) // SECONDS_PER_DAY
         return days_since_creation >= deletion_days
     
+    @staticmethod
+    def _retention_cutoffs(
+        policy: Mapping[str, Mapping[str, Any]],
+        days_key: str,
+        now_epoch_s: int
+    ) -> Dict[str, int]:
+        """Resolve a policy threshold into a created_at epoch cutoff per data type"""
+        cutoffs = {}
+        for data_type, config in policy.items():
+            days = config.get(days_key, 0)
+            if days > 0:
+                cutoffs[data_type] = now_epoch_s - days * SECONDS_PER_DAY
+        return cutoffs
+    
+    @staticmethod
+    def batch_should_anonymize(
+        rows: List[RetentionRow],
+        policy: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        now_epoch_s: Optional[int] = None
+    ) -> List[bool]:
+        """Check many retention rows against the anonymization policy"""
+        if policy is None:
+            policy = _DEFAULT_POLICY
+        if now_epoch_s is None:
+            now_epoch_s = int(time.time())
+        
+        cutoffs = AnonymizationService._retention_cutoffs(
+            policy, 'anonymization_after_days', now_epoch_s
+        )
+        return [
+            row.data_type in cutoffs and row.created_at_epoch_s <= cutoffs[row.data_type]
+            for row in rows
+        ]
+    
+    @staticmethod
+    def batch_should_delete(
+        rows: List[RetentionRow],
+        policy: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        now_epoch_s: Optional[int] = None
+    ) -> List[bool]:
+        """Check many retention rows against the deletion policy"""
+        if policy is None:
+            policy = _DEFAULT_POLICY
+        if now_epoch_s is None:
+            now_epoch_s = int(time.time())
+        
+        cutoffs = AnonymizationService._retention_cutoffs(
+            policy, 'deletion_after_days', now_epoch_s
+        )
+        return [
+            row.data_type in cutoffs and row.created_at_epoch_s <= cutoffs[row.data_type]
+            for row in rows
+        ]
+    
     @staticmethod
     def create_privacy_consent_record(
         user_id: str,
@@ -210,25 +420,13 @@ class AnonymizationService:
         time_period_days: int = 30
     ) -> Dict[str, Any]:
         """Generate a privacy compliance report"""
-        cutoff_date = datetime.utcnow() - timedelta(days=time_period_days)
-        
-        return {
-            'report_type': 'privacy_compliance',
-            'data_type': data_type,
-            'time_period_days': time_period_days,
-            'generated_at': datetime.utcnow(),
-            'cutoff_date': cutoff_date,
-            'metrics': {
-                'total_records': 0,  # Would be populated from database
-                'anonymized_records': 0,
-                'deleted_records': 0,
-                'pending_anonymization': 0,
-                'pending_deletion': 0
-            },
-            'compliance_status': 'compliant',  # Would be calculated based on metrics
-            'recommendations': [
-                'Review data retention policies quarterly',
-                'Implement automated anonymization processes',
-                'Regular privacy impact assessments'
-            ]
-        }
+        now = datetime.utcnow()
+        report = dict(_PRIVACY_REPORT_TEMPLATE)
+        report.update(
+            data_type=data_type,
+            time_period_days=time_period_days,
+            generated_at=now,
+            cutoff_date=now - timedelta(days=time_period_days),
+            metrics=dict(_EMPTY_PRIVACY_METRICS)
+        )
+        return report
@@ -2,18 +2,74 @@
 Audit trail and activity logging system
 """
 import asyncio
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, asdict
+import os
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Union
+from dataclasses import dataclass
 from enum import Enum
-import json
-import redis
+from itertools import islice
+from operator import attrgetter, itemgetter
+import orjson
+import redis.asyncio as redis
 import uuid
-import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Set-index key prefix for each filterable field, keyed by its name in the entry hash
+_INDEX_FIELDS = (
+    ('audit_user', 'user_id'),
+    ('audit_action', 'action'),
+    ('audit_level', 'level'),
+    ('audit_resource', 'resource_type'),
+    ('audit_resource_id', 'resource_id')
+)
+
+# Timestamp indexes; critical entries are kept apart because they are retained longer
+_TS_KEY = "audit_by_ts"
+_CRITICAL_TS_KEY = "audit_critical_by_ts"
+
+# Bump a windowed counter, starting its TTL on the first hit, and return the new count
+_COUNT_IN_WINDOW_LUA = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+
+# One connection pool per Redis URL, shared by every AuditService in the process
+_connection_pools: Dict[str, redis.ConnectionPool] = {}
+
+def _get_connection_pool(redis_url: str) -> redis.ConnectionPool:
+    """Get the shared connection pool for a Redis URL, creating it on first use"""
+    pool = _connection_pools.get(redis_url)
+    if pool is None:
+        pool = redis.ConnectionPool.from_url(
+            redis_url,
+            decode_responses=True,
+            max_connections=128,
+            socket_keepalive=True,
+            health_check_interval=30
+        )
+        _connection_pools[redis_url] = pool
+    return pool
+
+_CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+def _new_audit_id(timestamp_ms: int) -> str:
+    """Time-sortable 26-character ID: 48-bit millisecond timestamp + 80 random bits (ULID layout)"""
+    value = timestamp_ms << 80 | int.from_bytes(os.urandom(10), 'big')
+    return ''.join(_CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+def _epoch(value: datetime) -> float:
+    """Unix timestamp of a naive UTC datetime"""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
 class AuditAction(Enum):
     # User Management
     USER_CREATED = "user_created"
@@ -97,6 +153,12 @@ class AuditEntry:
     error_message: Optional[str] = None
     tags: List[str] = None
     metadata: Dict[str, Any] = None
+    
+    def __post_init__(self):
+        # Entries are not mutated after creation, so the enum values are read once here
+        # rather than through the Enum.value property in every sort and write
+        self._action_value = self.action.value
+        self._level_value = self.level.value
 
 @dataclass
 class AuditFilter:
@@ -110,14 +172,73 @@ class AuditFilter:
     end_date: Optional[datetime] = None
     success: Optional[bool] = None
     tags: Optional[List[str]] = None
+    
+    def compile(self) -> Callable[[AuditEntry], bool]:
+        """Build a predicate that checks only the fields this filter sets"""
+        checks = []
+        
+        if self.user_id:
+            user_id = self.user_id
+            checks.append(lambda entry: entry.user_id == user_id)
+        
+        if self.user_type:
+            user_type = self.user_type
+            checks.append(lambda entry: entry.user_type == user_type)
+        
+        if self.action:
+            action = self.action
+            checks.append(lambda entry: entry.action == action)
+        
+        if self.level:
+            level = self.level
+            checks.append(lambda entry: entry.level == level)
+        
+        if self.resource_type:
+            resource_type = self.resource_type
+            checks.append(lambda entry: entry.resource_type == resource_type)
+        
+        if self.resource_id:
+            resource_id = self.resource_id
+            checks.append(lambda entry: entry.resource_id == resource_id)
+        
+        if self.start_date:
+            start_date = self.start_date
+            checks.append(lambda entry: entry.timestamp >= start_date)
+        
+        if self.end_date:
+            end_date = self.end_date
+            checks.append(lambda entry: entry.timestamp <= end_date)
+        
+        if self.success is not None:
+            success = self.success
+            checks.append(lambda entry: entry.success == success)
+        
+        if self.tags:
+            tags = frozenset(self.tags)
+            checks.append(lambda entry: not tags.isdisjoint(entry.tags))
+        
+        if not checks:
+            return lambda entry: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda entry: all(check(entry) for check in checks)
 
 class AuditService:
     """Service for audit trail and activity logging"""
     
     def __init__(self, redis_url: str = None):
-        self.redis_client = redis.from_url(redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379'))
+        self.redis_client = redis.Redis(
+            connection_pool=_get_connection_pool(
+                redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379')
+            )
+        )
+        self._count_in_window_script = self.redis_client.register_script(_COUNT_IN_WINDOW_LUA)
         self.audit_retention_days = 365  # 1 year
         self.critical_retention_days = 2555  # 7 years
+        self.entry_cache_size = 10000
+        self.entry_cache_ttl = 300  # 5 minutes
+        self._entry_cache = OrderedDict()
+        self._background_tasks = set()
     
     async def log_activity(
         self,
@@ -139,8 +260,10 @@ class AuditService:
     ) -> str:
         """Log an audit entry"""
         try:
-            audit_id = str(uuid.uuid4())
-            now = datetime.utcnow()
+            # One clock read serves the ID, the stored timestamp and the index score
+            ts = time.time()
+            audit_id = _new_audit_id(int(ts * 1000))
+            now = datetime.utcfromtimestamp(ts)
             
             audit_entry = AuditEntry(
                 id=audit_id,
@@ -162,14 +285,18 @@ class AuditService:
                 metadata=metadata or {}
             )
             
-            # Store audit entry
-            await self._store_audit_entry(audit_entry)
+            # Store the entry and its indexes in one round trip
+            pipe = self.redis_client.pipeline()
+            await self._store_audit_entry(audit_entry, pipe)
+            await self._index_audit_entry(audit_entry, pipe, ts)
+            await pipe.execute()
+            self._cache_entry(audit_entry)
             
-            # Store in time-based index for efficient querying
-            await self._index_audit_entry(audit_entry)
-            
-            # Check for suspicious activity
-            await self._check_suspicious_activity(audit_entry)
+            # Check for suspicious activity in the background, off the logging path;
+            # the check logs its own errors
+            task = asyncio.create_task(self._check_suspicious_activity(audit_entry))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
             
             logger.info(f"Audit entry logged: {audit_id}")
             return audit_id
@@ -188,52 +315,29 @@ class AuditService:
     ) -> List[AuditEntry]:
         """Get audit entries with filters"""
         try:
-            # Build query based on filters
-            query_keys = []
-            
-            if filters.user_id:
-                query_keys.extend(self.redis_client.keys(f"audit_user:{filters.user_id}:*"))
-            
-            if filters.action:
-                query_keys.extend(self.redis_client.keys(f"audit_action:{filters.action.value}:*"))
-            
-            if filters.level:
-                query_keys.extend(self.redis_client.keys(f"audit_level:{filters.level.value}:*"))
-            
-            if filters.resource_type:
-                query_keys.extend(self.redis_client.keys(f"audit_resource:{filters.resource_type}:*"))
-            
-            if filters.resource_id:
-                query_keys.extend(self.redis_client.keys(f"audit_resource_id:{filters.resource_id}:*"))
+            # Indexed filters sorted by time can be paginated in Redis, fetching only the page
+            residual_filters = filters.user_type or filters.success is not None or filters.tags
+            if sort_by == "timestamp" and not residual_filters:
+                audit_ids = await self._page_audit_ids(filters, limit, offset, sort_order == "desc")
+                return [entry for entry in await self._get_audit_entries(audit_ids) if entry]
             
-            # If no specific filters, get all recent entries
-            if not query_keys:
-                query_keys = self.redis_client.keys("audit_entry:*")
-            
-            # Get unique audit entry IDs
-            audit_ids = set()
-            for key in query_keys:
-                if key.startswith("audit_entry:"):
-                    audit_ids.add(key.split(":")[1])
-                else:
-                    # Get audit IDs from index
-                    audit_ids.update(self.redis_client.smembers(key))
+            audit_ids = await self._query_audit_ids(filters)
             
             # Fetch audit entries
-            audit_entries = []
-            for audit_id in audit_ids:
-                audit_entry = await self._get_audit_entry(audit_id)
-                if audit_entry and self._matches_filters(audit_entry, filters):
-                    audit_entries.append(audit_entry)
+            matches = filters.compile()
+            audit_entries = [
+                entry for entry in await self._get_audit_entries(audit_ids)
+                if entry and matches(entry)
+            ]
             
             # Sort entries
             reverse = sort_order == "desc"
             if sort_by == "timestamp":
-                audit_entries.sort(key=lambda x: x.timestamp, reverse=reverse)
+                audit_entries.sort(key=attrgetter('timestamp'), reverse=reverse)
             elif sort_by == "level":
-                audit_entries.sort(key=lambda x: x.level.value, reverse=reverse)
+                audit_entries.sort(key=attrgetter('_level_value'), reverse=reverse)
             elif sort_by == "action":
-                audit_entries.sort(key=lambda x: x.action.value, reverse=reverse)
+                audit_entries.sort(key=attrgetter('_action_value'), reverse=reverse)
             
             # Apply pagination
             return audit_entries[offset:offset + limit]
@@ -296,52 +400,37 @@ class AuditService:
             start_date = datetime.utcnow() - timedelta(days=days)
             filters = AuditFilter(start_date=start_date, user_id=user_id)
             
-            entries = await self.get_audit_entries(filters, limit=10000)
+            # Only the fields counted below are read, not whole entries
+            audit_ids = await self._query_audit_ids(filters)
+            entries = await self._get_audit_fields(
+                audit_ids, ['timestamp', 'user_id', 'action', 'level', 'success']
+            )
+            entries.sort(key=itemgetter('timestamp'), reverse=True)
+            del entries[10000:]
             
             # Calculate statistics
             total_entries = len(entries)
-            successful_entries = len([e for e in entries if e.success])
+            successful_entries = sum(e['success'] == '1' for e in entries)
             failed_entries = total_entries - successful_entries
             
-            # Group by action
-            action_counts = {}
-            for entry in entries:
-                action = entry.action.value
-                action_counts[action] = action_counts.get(action, 0) + 1
-            
-            # Group by level
-            level_counts = {}
-            for entry in entries:
-                level = entry.level.value
-                level_counts[level] = level_counts.get(level, 0) + 1
-            
-            # Group by user
-            user_counts = {}
-            for entry in entries:
-                user = entry.user_id
-                user_counts[user] = user_counts.get(user, 0) + 1
+            # Group by action, level and user
+            action_counts = Counter(map(itemgetter('action'), entries))
+            level_counts = Counter(map(itemgetter('level'), entries))
+            user_counts = Counter(map(itemgetter('user_id'), entries))
             
             # Most active users
-            most_active_users = sorted(
-                user_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            most_active_users = user_counts.most_common(10)
             
             # Most common actions
-            most_common_actions = sorted(
-                action_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
+            most_common_actions = action_counts.most_common(10)
             
             return {
                 'total_entries': total_entries,
                 'successful_entries': successful_entries,
                 'failed_entries': failed_entries,
                 'success_rate': round((successful_entries / total_entries * 100), 2) if total_entries > 0 else 0,
-                'action_counts': action_counts,
-                'level_counts': level_counts,
+                'action_counts': dict(action_counts),
+                'level_counts': dict(level_counts),
                 'most_active_users': most_active_users,
                 'most_common_actions': most_common_actions,
                 'period_days': days
@@ -354,20 +443,23 @@ class AuditService:
     async def export_audit_log(
         self,
         filters: AuditFilter,
-        format: str = "json"
-    ) -> bytes:
-        """Export audit log in specified format"""
+        format: str = "json",
+        batch_size: int = 500
+    ) -> AsyncIterator[bytes]:
+        """Export audit log in specified format, streamed in batches of entries"""
+        if format not in ("json", "csv"):
+            raise ValueError(f"Unsupported format: {format}")
+        
+        import csv
+        import io
+        
         try:
-            entries = await self.get_audit_entries(filters, limit=10000)
+            # Only the IDs are held for the whole export; entries are fetched per batch
+            audit_ids = await self._page_audit_ids(filters, 10000, 0, True)
             
             if format == "json":
-                data = [asdict(entry) for entry in entries]
-                return json.dumps(data, indent=2, default=str).encode('utf-8')
-            
-            elif format == "csv":
-                import csv
-                import io
-                
+                yield b"["
+            else:
                 buffer = io.StringIO()
                 writer = csv.writer(buffer)
                 
@@ -377,30 +469,51 @@ class AuditService:
                     'Resource Type', 'Resource ID', 'Description', 'Success',
                     'IP Address', 'User Agent', 'Session ID', 'Error Message'
                 ])
+                yield buffer.getvalue().encode('utf-8')
+            
+            matches = filters.compile()
+            separator = b"\n"
+            for start in range(0, len(audit_ids), batch_size):
+                entries = [
+                    entry for entry in await self._get_audit_entries(audit_ids[start:start + batch_size])
+                    if entry and matches(entry)
+                ]
+                if not entries:
+                    continue
                 
-                # Write data
-                for entry in entries:
-                    writer.writerow([
-                        entry.id,
-                        entry.timestamp.isoformat(),
-                        entry.user_id,
-                        entry.user_type,
-                        entry.action.value,
-                        entry.level.value,
-                        entry.resource_type,
-                        entry.resource_id,
-                        entry.description,
-                        entry.success,
-                        entry.ip_address,
-                        entry.user_agent,
-                        entry.session_id,
-                        entry.error_message or ""
-                    ])
-                
-                return buffer.getvalue().encode('utf-8')
+                if format == "json":
+                    # orjson encodes the dataclasses, enums and datetimes natively
+                    for entry in entries:
+                        yield separator + orjson.dumps(
+                            entry, default=str, option=orjson.OPT_NON_STR_KEYS
+                        )
+                        separator = b",\n"
+                else:
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer)
+                    
+                    # Write data
+                    for entry in entries:
+                        writer.writerow([
+                            entry.id,
+                            entry.timestamp.isoformat(),
+                            entry.user_id,
+                            entry.user_type,
+                            entry._action_value,
+                            entry._level_value,
+                            entry.resource_type,
+                            entry.resource_id,
+                            entry.description,
+                            entry.success,
+                            entry.ip_address,
+                            entry.user_agent,
+                            entry.session_id,
+                            entry.error_message or ""
+                        ])
+                    yield buffer.getvalue().encode('utf-8')
             
-            else:
-                raise ValueError(f"Unsupported format: {format}")
+            if format == "json":
+                yield b"\n]"
                 
         except Exception as e:
             logger.error(f"Export audit log error: {e}")
@@ -410,30 +523,22 @@ class AuditService:
         """Clean up old audit entries based on retention policy"""
         try:
             now = datetime.utcnow()
-            regular_cutoff = now - timedelta(days=self.audit_retention_days)
-            critical_cutoff = now - timedelta(days=self.critical_retention_days)
-            
             cleaned_count = 0
             
-            # Get all audit entries
-            pattern = "audit_entry:*"
-            keys = self.redis_client.keys(pattern)
-            
-            for key in keys:
-                audit_entry = await self._get_audit_entry(key.split(":")[1])
-                if audit_entry:
-                    should_delete = False
-                    
-                    if audit_entry.level == AuditLevel.CRITICAL:
-                        if audit_entry.timestamp < critical_cutoff:
-                            should_delete = True
-                    else:
-                        if audit_entry.timestamp < regular_cutoff:
-                            should_delete = True
-                    
-                    if should_delete:
-                        await self._delete_audit_entry(audit_entry.id)
-                        cleaned_count += 1
+            # Each timestamp index is expired oldest-first, a batch at a time
+            for ts_key, retention_days in (
+                (_TS_KEY, self.audit_retention_days),
+                (_CRITICAL_TS_KEY, self.critical_retention_days)
+            ):
+                cutoff = _epoch(now - timedelta(days=retention_days))
+                while True:
+                    audit_ids = await self.redis_client.zrangebyscore(
+                        ts_key, "-inf", f"({cutoff}", start=0, num=1000
+                    )
+                    if not audit_ids:
+                        break
+                    await self._delete_audit_entries(ts_key, audit_ids)
+                    cleaned_count += len(audit_ids)
             
             logger.info(f"Cleaned up {cleaned_count} old audit entries")
             return cleaned_count
@@ -442,113 +547,266 @@ class AuditService:
             logger.error(f"Cleanup old audit entries error: {e}")
             return 0
     
-    async def _store_audit_entry(self, audit_entry: AuditEntry):
-        """Store audit entry in Redis"""
-        key = f"audit_entry:{audit_entry.id}"
-        data = json.dumps(asdict(audit_entry), default=str)
-        self.redis_client.set(key, data, ex=86400 * self.audit_retention_days)
+    def _filter_index_keys(self, filters: AuditFilter) -> List[str]:
+        """Set keys of the indexes selected by the filter's indexed fields"""
+        index_keys = []
+        
+        if filters.user_id:
+            index_keys.append(f"audit_user:{filters.user_id}")
+        
+        if filters.action:
+            index_keys.append(f"audit_action:{filters.action.value}")
+        
+        if filters.level:
+            index_keys.append(f"audit_level:{filters.level.value}")
+        
+        if filters.resource_type:
+            index_keys.append(f"audit_resource:{filters.resource_type}")
+        
+        if filters.resource_id:
+            index_keys.append(f"audit_resource_id:{filters.resource_id}")
+        
+        return index_keys
     
-    async def _get_audit_entry(self, audit_id: str) -> Optional[AuditEntry]:
-        """Get audit entry from Redis"""
-        key = f"audit_entry:{audit_id}"
-        data = self.redis_client.get(key)
-        if data:
-            entry_dict = json.loads(data)
-            return AuditEntry(**entry_dict)
-        return None
-    
-    async def _delete_audit_entry(self, audit_id: str):
-        """Delete audit entry from Redis"""
-        key = f"audit_entry:{audit_id}"
-        self.redis_client.delete(key)
-        
-        # Also delete from indexes
-        pattern = f"*:{audit_id}"
-        index_keys = self.redis_client.keys(pattern)
-        for index_key in index_keys:
-            self.redis_client.delete(index_key)
-    
-    async def _index_audit_entry(self, audit_entry: AuditEntry):
-        """Index audit entry for efficient querying"""
-        try:
-            # Index by user
-            user_key = f"audit_user:{audit_entry.user_id}:{audit_entry.id}"
-            self.redis_client.set(user_key, audit_entry.id, ex=86400 * self.audit_retention_days)
-            
-            # Index by action
-            action_key = f"audit_action:{audit_entry.action.value}:{audit_entry.id}"
-            self.redis_client.set(action_key, audit_entry.id, ex=86400 * self.audit_retention_days)
-            
-            # Index by level
-            level_key = f"audit_level:{audit_entry.level.value}:{audit_entry.id}"
-            self.redis_client.set(level_key, audit_entry.id, ex=86400 * self.audit_retention_days)
-            
-            # Index by resource type
-            resource_key = f"audit_resource:{audit_entry.resource_type}:{audit_entry.id}"
-            self.redis_client.set(resource_key, audit_entry.id, ex=86400 * self.audit_retention_days)
-            
-            # Index by resource ID
-            resource_id_key = f"audit_resource_id:{audit_entry.resource_id}:{audit_entry.id}"
-            self.redis_client.set(resource_id_key, audit_entry.id, ex=86400 * self.audit_retention_days)
-            
-            # Index by timestamp (for time-based queries)
-            timestamp_key = f"audit_timestamp:{audit_entry.timestamp.strftime('%Y-%m-%d')}:{audit_entry.id}"
-            self.redis_client.set(timestamp_key, audit_entry.id, ex=86400 * self.audit_retention_days)
-            
-        except Exception as e:
-            logger.error(f"Index audit entry error: {e}")
+    async def _query_audit_ids(self, filters: AuditFilter) -> set:
+        """Resolve the indexed filter fields to a set of candidate audit IDs"""
+        # Each filter maps to a set of audit IDs; intersect them server-side
+        index_keys = self._filter_index_keys(filters)
+        audit_ids = await self.redis_client.sinter(*index_keys) if index_keys else None
+        
+        # Date ranges (and unfiltered queries) come from the timestamp indexes
+        if filters.start_date or filters.end_date or audit_ids is None:
+            min_score = _epoch(filters.start_date) if filters.start_date else "-inf"
+            max_score = _epoch(filters.end_date) if filters.end_date else "+inf"
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zrangebyscore(_TS_KEY, min_score, max_score)
+            pipe.zrangebyscore(_CRITICAL_TS_KEY, min_score, max_score)
+            regular_ids, critical_ids = await pipe.execute()
+            in_range = set(regular_ids).union(critical_ids)
+            audit_ids = in_range if audit_ids is None else audit_ids & in_range
+        
+        return audit_ids
     
-    def _matches_filters(self, audit_entry: AuditEntry, filters: AuditFilter) -> bool:
-        """Check if audit entry matches filters"""
-        if filters.user_id and audit_entry.user_id != filters.user_id:
-            return False
+    async def _page_audit_ids(
+        self,
+        filters: AuditFilter,
+        limit: int,
+        offset: int,
+        descending: bool
+    ) -> List[str]:
+        """Resolve one page of audit IDs, ordered by timestamp, in a single round trip"""
+        index_keys = self._filter_index_keys(filters)
+        min_score = _epoch(filters.start_date) if filters.start_date else "-inf"
+        max_score = _epoch(filters.end_date) if filters.end_date else "+inf"
+        
+        ts_keys = [_TS_KEY, _CRITICAL_TS_KEY]
+        temp_keys = []
+        pipe = self.redis_client.pipeline()
         
-        if filters.user_type and audit_entry.user_type != filters.user_type:
-            return False
+        if index_keys:
+            # Intersect each timestamp index with the filter sets; the sets are
+            # weighted 0 so the results keep their timestamp scores
+            query_id = uuid.uuid4().hex
+            temp_keys = [f"audit_query:{query_id}:{ts_key}" for ts_key in ts_keys]
+            for temp_key, ts_key in zip(temp_keys, ts_keys):
+                pipe.zinterstore(temp_key, {ts_key: 1, **{key: 0 for key in index_keys}})
+            ts_keys = temp_keys
         
-        if filters.action and audit_entry.action != filters.action:
-            return False
+        # Neither index can contribute more than offset + limit IDs to the page
+        for ts_key in ts_keys:
+            if descending:
+                pipe.zrevrangebyscore(
+                    ts_key, max_score, min_score, start=0, num=offset + limit, withscores=True
+                )
+            else:
+                pipe.zrangebyscore(
+                    ts_key, min_score, max_score, start=0, num=offset + limit, withscores=True
+                )
+        
+        if temp_keys:
+            pipe.unlink(*temp_keys)
+        
+        results = await pipe.execute()
+        regular, critical = results[len(temp_keys):len(temp_keys) + 2]
+        merged = heapq.merge(regular, critical, key=itemgetter(1), reverse=descending)
+        return [audit_id for audit_id, _ in islice(merged, offset, offset + limit)]
+    
+    async def _store_audit_entry(self, audit_entry: AuditEntry, pipe):
+        """Queue the audit entry write on a Redis pipeline"""
+        key = f"audit_entry:{audit_entry.id}"
         
-        if filters.level and audit_entry.level != filters.level:
-            return False
+        # One hash field per attribute so hot paths can HMGET just what they need;
+        # only the nested values are JSON-encoded
+        fields = {
+            'id': audit_entry.id,
+            'timestamp': audit_entry.timestamp.isoformat(),
+            'user_id': audit_entry.user_id,
+            'user_type': audit_entry.user_type,
+            'action': audit_entry._action_value,
+            'level': audit_entry._level_value,
+            'resource_type': audit_entry.resource_type,
+            'resource_id': audit_entry.resource_id,
+            'description': audit_entry.description,
+            'details': orjson.dumps(audit_entry.details, default=str, option=orjson.OPT_NON_STR_KEYS),
+            'ip_address': audit_entry.ip_address,
+            'user_agent': audit_entry.user_agent,
+            'session_id': audit_entry.session_id,
+            'success': int(audit_entry.success),
+            'tags': orjson.dumps(audit_entry.tags),
+            'metadata': orjson.dumps(audit_entry.metadata, default=str, option=orjson.OPT_NON_STR_KEYS)
+        }
+        if audit_entry.error_message is not None:
+            fields['error_message'] = audit_entry.error_message
         
-        if filters.resource_type and audit_entry.resource_type != filters.resource_type:
-            return False
+        pipe.hset(key, mapping=fields)
+        if audit_entry.level == AuditLevel.CRITICAL:
+            pipe.expire(key, 86400 * self.critical_retention_days)
+        else:
+            pipe.expire(key, 86400 * self.audit_retention_days)
+    
+    async def _get_audit_entry(self, audit_id: str) -> Optional[AuditEntry]:
+        """Get audit entry from the local cache or Redis"""
+        return (await self._get_audit_entries([audit_id]))[0]
+    
+    async def _get_audit_entries(self, audit_ids) -> List[Optional[AuditEntry]]:
+        """Get many audit entries, fetching cache misses from Redis in one round trip"""
+        audit_ids = list(audit_ids)
+        entries = [self._cached_entry(audit_id) for audit_id in audit_ids]
+        missing = [i for i, entry in enumerate(entries) if entry is None]
         
-        if filters.resource_id and audit_entry.resource_id != filters.resource_id:
-            return False
+        if missing:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for i in missing:
+                pipe.hgetall(f"audit_entry:{audit_ids[i]}")
+            for i, data in zip(missing, await pipe.execute()):
+                if data:
+                    entries[i] = self._entry_from_hash(data)
+                    self._cache_entry(entries[i])
         
-        if filters.start_date and audit_entry.timestamp < filters.start_date:
-            return False
+        return entries
+    
+    def _cache_entry(self, audit_entry: AuditEntry):
+        """Keep an entry in the local LRU cache; entries never change once written"""
+        self._entry_cache[audit_entry.id] = (time.monotonic() + self.entry_cache_ttl, audit_entry)
+        self._entry_cache.move_to_end(audit_entry.id)
+        if len(self._entry_cache) > self.entry_cache_size:
+            self._entry_cache.popitem(last=False)
+    
+    def _cached_entry(self, audit_id: str) -> Optional[AuditEntry]:
+        """Get an entry from the local cache if it is there and not stale"""
+        cached = self._entry_cache.get(audit_id)
+        if cached is None:
+            return None
         
-        if filters.end_date and audit_entry.timestamp > filters.end_date:
-            return False
+        expires_at, audit_entry = cached
+        if expires_at < time.monotonic():
+            del self._entry_cache[audit_id]
+            return None
         
-        if filters.success is not None and audit_entry.success != filters.success:
-            return False
+        self._entry_cache.move_to_end(audit_id)
+        return audit_entry
+    
+    def _entry_from_hash(self, data: Dict[str, str]) -> AuditEntry:
+        """Rebuild an audit entry from its Redis hash fields"""
+        return AuditEntry(
+            id=data['id'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            user_id=data['user_id'],
+            user_type=data['user_type'],
+            action=AuditAction(data['action']),
+            level=AuditLevel(data['level']),
+            resource_type=data['resource_type'],
+            resource_id=data['resource_id'],
+            description=data['description'],
+            details=orjson.loads(data['details']),
+            ip_address=data['ip_address'],
+            user_agent=data['user_agent'],
+            session_id=data['session_id'],
+            success=data['success'] == '1',
+            error_message=data.get('error_message'),
+            tags=orjson.loads(data['tags']),
+            metadata=orjson.loads(data['metadata'])
+        )
+    
+    async def _get_audit_fields(self, audit_ids, fields: List[str]) -> List[Dict[str, Optional[str]]]:
+        """Read selected fields of many audit entries in one round trip"""
+        pipe = self.redis_client.pipeline(transaction=False)
+        for audit_id in audit_ids:
+            pipe.hmget(f"audit_entry:{audit_id}", fields)
+        rows = await pipe.execute()
         
-        if filters.tags:
-            if not any(tag in audit_entry.tags for tag in filters.tags):
-                return False
+        # Entries that expired after being indexed come back as all-None
+        return [
+            dict(zip(fields, values))
+            for values in rows
+            if any(value is not None for value in values)
+        ]
+    
+    async def _delete_audit_entries(self, ts_key: str, audit_ids: List[str]):
+        """Delete audit entries and their index memberships from Redis"""
+        fields = [name for _, name in _INDEX_FIELDS]
+        pipe = self.redis_client.pipeline(transaction=False)
+        for audit_id in audit_ids:
+            pipe.hmget(f"audit_entry_dims:{audit_id}", fields)
+        rows = await pipe.execute()
         
-        return True
+        pipe = self.redis_client.pipeline()
+        for audit_id, values in zip(audit_ids, rows):
+            self._entry_cache.pop(audit_id, None)
+            pipe.unlink(f"audit_entry:{audit_id}", f"audit_entry_dims:{audit_id}")
+            
+            # Also delete from indexes
+            if values[0] is not None:
+                for index_key in self._index_keys(dict(zip(fields, values))):
+                    pipe.srem(index_key, audit_id)
+        pipe.zrem(ts_key, *audit_ids)
+        await pipe.execute()
+    
+    def _index_keys(self, values: Dict[str, str]) -> List[str]:
+        """Set keys holding the IDs of entries that share each filterable field"""
+        return [f"{prefix}:{values[name]}" for prefix, name in _INDEX_FIELDS]
+    
+    async def _index_audit_entry(self, audit_entry: AuditEntry, pipe, ts: Optional[float] = None):
+        """Queue the index writes for an audit entry on a Redis pipeline"""
+        try:
+            # Add the entry to the ID set of each field it can be filtered by. Set
+            # members can't expire individually, so cleanup removes them using the
+            # field values kept (without a TTL) in audit_entry_dims
+            index_values = {
+                'user_id': audit_entry.user_id,
+                'action': audit_entry._action_value,
+                'level': audit_entry._level_value,
+                'resource_type': audit_entry.resource_type,
+                'resource_id': audit_entry.resource_id
+            }
+            for index_key in self._index_keys(index_values):
+                pipe.sadd(index_key, audit_entry.id)
+            pipe.hset(f"audit_entry_dims:{audit_entry.id}", mapping=index_values)
+            
+            # Index by timestamp (for time-based queries and retention)
+            ts_key = _CRITICAL_TS_KEY if audit_entry.level == AuditLevel.CRITICAL else _TS_KEY
+            if ts is None:
+                ts = _epoch(audit_entry.timestamp)
+            pipe.zadd(ts_key, {audit_entry.id: ts})
+            
+        except Exception as e:
+            logger.error(f"Index audit entry error: {e}")
+    
+    async def _count_in_window(self, key_prefix: str, window_seconds: int) -> int:
+        """Count an event in the current fixed time window and return the running total"""
+        key = f"{key_prefix}:{int(time.time() // window_seconds)}"
+        return await self._count_in_window_script(keys=[key], args=[window_seconds])
     
     async def _check_suspicious_activity(self, audit_entry: AuditEntry):
         """Check for suspicious activity patterns"""
         try:
             # Check for multiple failed login attempts
             if audit_entry.action == AuditAction.USER_LOGIN and not audit_entry.success:
-                recent_failures = await self.get_audit_entries(
-                    AuditFilter(
-                        user_id=audit_entry.user_id,
-                        action=AuditAction.USER_LOGIN,
-                        success=False,
-                        start_date=datetime.utcnow() - timedelta(minutes=15)
-                    ),
-                    limit=10
+                recent_failures = await self._count_in_window(
+                    f"audit_suspicious:login_failed:{audit_entry.user_id}", 900
                 )
                 
-                if len(recent_failures) >= 5:
+                if recent_failures >= 5:
                     await self.log_activity(
                         user_id="system",
                         user_type="system",
@@ -557,7 +815,7 @@ class AuditService:
                         resource_id=audit_entry.user_id,
                         description=f"Multiple failed login attempts detected for user {audit_entry.user_id}",
                         details={
-                            "failed_attempts": len(recent_failures),
+                            "failed_attempts": recent_failures,
                             "time_window": "15 minutes",
                             "ip_address": audit_entry.ip_address
                         },
@@ -569,16 +827,11 @@ class AuditService:
             
             # Check for unusual access patterns
             if audit_entry.action in [AuditAction.REPORT_DOWNLOADED, AuditAction.DATA_EXPORTED]:
-                recent_access = await self.get_audit_entries(
-                    AuditFilter(
-                        user_id=audit_entry.user_id,
-                        action=audit_entry.action,
-                        start_date=datetime.utcnow() - timedelta(hours=1)
-                    ),
-                    limit=20
+                recent_access = await self._count_in_window(
+                    f"audit_suspicious:{audit_entry._action_value}:{audit_entry.user_id}", 3600
                 )
                 
-                if len(recent_access) >= 10:
+                if recent_access >= 10:
                     await self.log_activity(
                         user_id="system",
                         user_type="system",
@@ -587,8 +840,8 @@ class AuditService:
                         resource_id=audit_entry.user_id,
                         description=f"Unusual access pattern detected for user {audit_entry.user_id}",
                         details={
-                            "action": audit_entry.action.value,
-                            "access_count": len(recent_access),
+                            "action": audit_entry._action_value,
+                            "access_count": recent_access,
                             "time_window": "1 hour"
                         },
                         level=AuditLevel.MEDIUM,
@@ -1,37 +1,147 @@
-from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-import jwt
+from itertools import islice
+from typing import Optional, Dict, Any, Tuple
+import aiosmtplib
+import asyncio
+import hashlib
+import hmac
 import os
 import logging
 import bcrypt
+import math
 import secrets
-import smtplib
+import string
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from models import Admin, Student
 from database import DatabaseOperations
 
+# Optional Rust-backed JWT implementation with the PyJWT API; PyJWT is the default
+if os.environ.get("USE_JWT_RS", "0") == "1":
+    try:
+        import jwt_rs as jwt
+    except ImportError:
+        import jwt
+else:
+    import jwt
+
 logger = logging.getLogger(__name__)
 
-# Password hashing - use bcrypt directly for better compatibility
+# Argon2id for new password hashes when argon2-cffi is installed; bcrypt hashes
+# still verify and are upgraded on the next successful login
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    _ARGON = PasswordHasher(time_cost=3, memory_cost=65536, parallelism=4)
+except ImportError:
+    _ARGON = None
+
+_ARGON_PREFIX = "$argon2"
+
+# bcrypt cost factor; each extra round doubles the work. Existing hashes keep the
+# cost they were created with, so changing this only affects new hashes
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+BCRYPT_MIN_ROUNDS = 10
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+_BCRYPT_HASH_LEN = 60
+
+# Password hashing - Argon2id when available, otherwise bcrypt directly
 def hash_password(password: str) -> str:
-    """Hash password using bcrypt directly"""
+    """Hash password with Argon2id, or bcrypt if argon2-cffi isn't installed"""
+    if _ARGON is not None:
+        return _ARGON.hash(password)
+    return _bcrypt_hash(password)
+
+def _bcrypt_hash(password: str) -> str:
+    """Hash password with bcrypt at the configured cost"""
     # Use bcrypt with proper handling for longer passwords
     password_bytes = password.encode('utf-8')
-    # Use bcrypt with higher rounds for better security
-    salt = bcrypt.gensalt(rounds=14)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
 
+def calibrate_bcrypt_rounds(target_ms: float) -> int:
+    """Pick the largest bcrypt cost whose hash time on this machine fits target_ms"""
+    global BCRYPT_ROUNDS
+    
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration-probe", bcrypt.gensalt(rounds=BCRYPT_MIN_ROUNDS))
+    probe_ms = (time.perf_counter() - start) * 1000
+    
+    # Cost doubles per round, so every doubling of the budget buys one more round
+    extra_rounds = int(math.log2(target_ms / probe_ms)) if target_ms > probe_ms else 0
+    BCRYPT_ROUNDS = min(BCRYPT_MIN_ROUNDS + extra_rounds, 16)
+    logger.info(f"bcrypt cost calibrated to {BCRYPT_ROUNDS} rounds for a {target_ms}ms target")
+    return BCRYPT_ROUNDS
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password using bcrypt directly"""
+    """Verify password against an Argon2id or bcrypt hash"""
     try:
+        if hashed_password.startswith(_ARGON_PREFIX):
+            if _ARGON is None:
+                logger.error("Argon2 hash found but argon2-cffi is not installed")
+                return False
+            try:
+                return _ARGON.verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False
+        
+        # Reject anything that isn't a bcrypt hash before paying for the key schedule
+        if len(hashed_password) != _BCRYPT_HASH_LEN or not hashed_password.startswith(_BCRYPT_PREFIXES):
+            return False
         password_bytes = plain_password.encode('utf-8')
         return bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
     except Exception as e:
         logger.error(f"Password verification failed: {e}")
         return False
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a verified hash should be replaced with one using the current scheme"""
+    if _ARGON is None:
+        return False
+    if not hashed_password.startswith(_ARGON_PREFIX):
+        return True
+    return _ARGON.check_needs_rehash(hashed_password)
+
+# Password hashing is deliberately slow; run it on worker threads so it doesn't block the event loop.
+# Each Argon2 hash holds memory_cost (64 MiB) and already uses several threads, so
+# concurrent Argon2 work is capped to bound memory during a login burst
+_ARGON_MAX_CONCURRENT = 4
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=min(os.cpu_count() or 1, _ARGON_MAX_CONCURRENT) if _ARGON is not None else os.cpu_count(),
+    thread_name_prefix="bcrypt"
+)
+
+async def ahash_password(password: str) -> str:
+    """Hash password on the password hashing thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, hash_password, password)
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password on the password hashing thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, verify_password, plain_password, hashed_password)
+
+# Hashes checked on unknown usernames so a miss costs the same hashing time as a wrong
+# password; created on first use so they pick up the configured or calibrated cost.
+# Accounts not yet upgraded still verify with bcrypt, so while Argon2 is in use there is
+# a dummy per scheme and each unknown username is consistently given one of them
+_DUMMY_HASHES: Dict[str, str] = {}
+
+async def _get_dummy_hash(username: str) -> str:
+    """Return the password hash used to equalize timing for an unknown user"""
+    scheme = "bcrypt"
+    if _ARGON is not None and hmac.digest(SECRET_KEY.encode(), username.encode(), "sha256")[0] & 1:
+        scheme = "argon2"
+    if scheme not in _DUMMY_HASHES:
+        hasher = hash_password if scheme == "argon2" else _bcrypt_hash
+        loop = asyncio.get_running_loop()
+        _DUMMY_HASHES[scheme] = await loop.run_in_executor(_BCRYPT_POOL, hasher, secrets.token_urlsafe(16))
+    return _DUMMY_HASHES[scheme]
+
 # JWT settings
 SECRET_KEY = os.environ.get("SECRET_KEY")
 if not SECRET_KEY:
@@ -40,6 +150,82 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES", "4320"))  # 3 days default
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS", "7"))  # 7 days default
 
+# Token lifetimes in seconds, for integer exp claims
+_ACCESS_TOKEN_TTL_S = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL_S = REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+# Verified access-token payloads, keyed by a digest of the token so raw tokens aren't
+# kept in memory; each entry is only served until the token's own exp
+_TOKEN_CACHE: Dict[bytes, Tuple[float, Dict[str, Any]]] = {}
+_TOKEN_CACHE_MAX_SIZE = 1024
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Users resolved from access tokens, keyed by (collection, id). Entries live for at
+# most _USER_CACHE_TTL seconds (never past the token's exp). Routes that change an
+# admin or student evict it, but only in the worker that handled the change; other
+# workers can serve the old record until their entry expires
+_USER_CACHE: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_USER_CACHE_TTL = 10
+_USER_CACHE_MAX_SIZE = 1024
+
+def _get_cached_user(collection: str, user_id: str) -> Optional[Any]:
+    """Return a cached Admin/Student if it hasn't expired"""
+    cached = _USER_CACHE.get((collection, user_id))
+    if cached is None:
+        return None
+    expires_at, user = cached
+    if time.time() >= expires_at:
+        _USER_CACHE.pop((collection, user_id), None)
+        return None
+    return user
+
+def _cache_user(collection: str, user_id: str, user: Any, token_exp: Optional[float]):
+    """Cache a resolved Admin/Student for the shorter of the TTL and the token's lifetime"""
+    expires_at = time.time() + _USER_CACHE_TTL
+    if token_exp is not None:
+        expires_at = min(expires_at, token_exp)
+    if len(_USER_CACHE) >= _USER_CACHE_MAX_SIZE:
+        for stale_key in list(islice(_USER_CACHE, _USER_CACHE_MAX_SIZE // 10)):
+            _USER_CACHE.pop(stale_key, None)
+    _USER_CACHE[(collection, user_id)] = (expires_at, user)
+
+def _hash_reset_token(token: str) -> str:
+    """Keyed digest of a password reset token; only the digest is stored"""
+    return hashlib.blake2b(token.encode(), key=SECRET_KEY.encode()[:64], digest_size=32).hexdigest()
+
+@dataclass(frozen=True)
+class _SMTPConfig:
+    """Mail settings for password reset emails, read from the environment once"""
+    server: str
+    port: int
+    username: Optional[str]
+    password: Optional[str]
+    frontend_url: str
+
+_SMTP_CFG = _SMTPConfig(
+    server=os.environ.get("SMTP_SERVER", "smtp.gmail.com"),
+    port=int(os.environ.get("SMTP_PORT", "587")),
+    username=os.environ.get("SMTP_USERNAME"),
+    password=os.environ.get("SMTP_PASSWORD"),
+    frontend_url=os.environ.get("FRONTEND_URL", "http://localhost:3000")
+)
+
+# Password reset email, built once at import; only the reset URL changes per send
+_RESET_SUBJECT = "Password Reset Request - Student Feedback System"
+_RESET_BODY_TMPL = string.Template("""
+You have requested a password reset for your account.
+
+Click the link below to reset your password:
+${reset_url}
+
+This link will expire in 1 hour.
+
+If you did not request this password reset, please ignore this email.
+
+Best regards,
+Student Feedback System Team
+""")
+
 class AuthService:
     
     @staticmethod
@@ -61,19 +247,28 @@ class AuthService:
         """Create JWT access token"""
         to_encode = data.copy()
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = int(time.time() + expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+            expire = int(time.time()) + _ACCESS_TOKEN_TTL_S
         
         to_encode.update({"exp": expire, "type": "access"})
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
     
+    @staticmethod
+    def create_access_token_for(sub: str, role: str, ttl_s: int = _ACCESS_TOKEN_TTL_S) -> str:
+        """Create JWT access token for a user id and role without copying a claims dict"""
+        return jwt.encode(
+            {"sub": sub, "role": role, "exp": int(time.time()) + ttl_s, "type": "access"},
+            SECRET_KEY,
+            algorithm=ALGORITHM
+        )
+    
     @staticmethod
     def create_refresh_token(data: Dict[str, Any]) -> str:
         """Create JWT refresh token"""
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+        expire = int(time.time()) + _REFRESH_TOKEN_TTL_S
         to_encode.update({"exp": expire, "type": "refresh"})
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
@@ -96,15 +291,32 @@ class AuthService:
     @staticmethod
     def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
         """Decode JWT access token"""
+        cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is not None:
+            expires_at, payload = cached
+            if time.time() < expires_at:
+                return dict(payload)
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE.pop(cache_key, None)
+        
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             if payload.get("type") != "access":
                 return None
-            return payload
         except jwt.ExpiredSignatureError:
             return None
         except jwt.InvalidTokenError:
             return None
+        
+        if "exp" in payload:
+            with _TOKEN_CACHE_LOCK:
+                if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAX_SIZE:
+                    # Evict the oldest tenth rather than tracking recency per hit
+                    for stale_key in list(islice(_TOKEN_CACHE, _TOKEN_CACHE_MAX_SIZE // 10)):
+                        del _TOKEN_CACHE[stale_key]
+                _TOKEN_CACHE[cache_key] = (payload["exp"], payload)
+        return dict(payload)
     
     @staticmethod
     def decode_refresh_token(token: str) -> Optional[Dict[str, Any]]:
@@ -128,27 +340,45 @@ class AuthService:
         )
         
         if not admin_data:
+            # Verify against a dummy hash so response time doesn't reveal unknown usernames
+            await averify_password(password, await _get_dummy_hash(username))
             return None
         
         # Password will be handled by the verify_password function
         
         try:
-            if not AuthService.verify_password(password, admin_data["password_hash"]):
+            if not await averify_password(password, admin_data["password_hash"]):
                 return None
         except Exception as e:
             # If password verification fails due to bcrypt issues, return None
             print(f"Password verification error for {username}: {e}")
             return None
+        
+        # Move bcrypt (or outdated Argon2) hashes to the current parameters now that
+        # we have the plaintext; a failure here shouldn't block the login
+        if password_needs_rehash(admin_data["password_hash"]):
+            try:
+                password_hash = await ahash_password(password)
+                await DatabaseOperations.update_one(
+                    "admins",
+                    {"id": admin_data["id"]},
+                    {"password_hash": password_hash}
+                )
+                admin_data["password_hash"] = password_hash
+            except Exception as e:
+                logger.error(f"Password hash upgrade failed for {username}: {e}")
             
         return Admin(**admin_data)
     
     @staticmethod
     async def authenticate_student(reg_number: str, dob: str) -> Optional[Student]:
         """Authenticate student using registration number and DOB"""
+        # reg_number is stored in the canonical stripped, uppercased form (see
+        # Student.validate_reg_number), so an exact match is served by its unique index
         student_data = await DatabaseOperations.find_one(
             "students",
             {
-                "reg_number": reg_number.upper(),
+                "reg_number": reg_number.strip().upper(),
                 "dob": dob,
                 "is_active": True
             }
@@ -169,12 +399,18 @@ class AuthService:
         admin_id = payload.get("sub")
         if not admin_id:
             return None
+        
+        admin = _get_cached_user("admins", admin_id)
+        if admin is not None:
+            return admin
             
         admin_data = await DatabaseOperations.find_one("admins", {"id": admin_id})
         if not admin_data:
             return None
-            
-        return Admin(**admin_data)
+        
+        admin = Admin(**admin_data)
+        _cache_user("admins", admin_id, admin, payload.get("exp"))
+        return admin
     
     @staticmethod
     async def get_current_student(token: str) -> Optional[Student]:
@@ -186,6 +422,10 @@ class AuthService:
         student_id = payload.get("sub")
         if not student_id:
             return None
+        
+        student = _get_cached_user("students", student_id)
+        if student is not None:
+            return student
             
         student_data = await DatabaseOperations.find_one(
             "students", 
@@ -193,8 +433,15 @@ class AuthService:
         )
         if not student_data:
             return None
-            
-        return Student(**student_data)
+        
+        student = Student(**student_data)
+        _cache_user("students", student_id, student, payload.get("exp"))
+        return student
+    
+    @staticmethod
+    def invalidate_cached_user(collection: str, user_id: str):
+        """Drop a user from the token lookup cache after changing their record"""
+        _USER_CACHE.pop((collection, user_id), None)
     
     @staticmethod
     async def request_password_reset(email: str) -> bool:
@@ -211,12 +458,12 @@ class AuthService:
                 return True
             
             # Generate reset token
-            reset_token = secrets.token_urlsafe(32)
+            reset_token = secrets.token_urlsafe(24)
             expires_at = datetime.utcnow() + timedelta(hours=1)  # 1 hour expiry
             
             # Store reset token in database
             await DatabaseOperations.insert_one("password_reset_tokens", {
-                "token": reset_token,
+                "token_hash": _hash_reset_token(reset_token),
                 "user_id": admin_data["id"],
                 "user_type": "admin",
                 "email": email,
@@ -238,21 +485,24 @@ class AuthService:
     async def reset_password(token: str, new_password: str) -> bool:
         """Reset password using token"""
         try:
-            # Find valid reset token
-            reset_data = await DatabaseOperations.find_one(
+            # Find and consume the reset token in one step so it can't be replayed
+            token_hash = _hash_reset_token(token)
+            now = datetime.utcnow()
+            reset_data = await DatabaseOperations.find_one_and_update(
                 "password_reset_tokens",
                 {
-                    "token": token,
+                    "token_hash": token_hash,
                     "used": False,
-                    "expires_at": {"$gt": datetime.utcnow()}
-                }
+                    "expires_at": {"$gt": now}
+                },
+                {"used": True, "used_at": now}
             )
             
-            if not reset_data:
+            if not reset_data or not hmac.compare_digest(reset_data["token_hash"], token_hash):
                 return False
             
             # Hash new password
-            password_hash = AuthService.get_password_hash(new_password)
+            password_hash = await ahash_password(new_password)
             
             # Update user password
             if reset_data["user_type"] == "admin":
@@ -261,17 +511,11 @@ class AuthService:
                     {"id": reset_data["user_id"]},
                     {"password_hash": password_hash}
                 )
+                AuthService.invalidate_cached_user("admins", reset_data["user_id"])
             else:
                 # Student password reset not implemented yet
                 return False
             
-            # Mark token as used
-            await DatabaseOperations.update_one(
-                "password_reset_tokens",
-                {"token": token},
-                {"used": True, "used_at": datetime.utcnow()}
-            )
-            
             return True
             
         except Exception as e:
@@ -282,47 +526,31 @@ class AuthService:
     async def _send_password_reset_email(email: str, token: str):
         """Send password reset email"""
         try:
-            # Email configuration
-            smtp_server = os.environ.get("SMTP_SERVER", "smtp.gmail.com")
-            smtp_port = int(os.environ.get("SMTP_PORT", "587"))
-            smtp_username = os.environ.get("SMTP_USERNAME")
-            smtp_password = os.environ.get("SMTP_PASSWORD")
-            
-            if not smtp_username or not smtp_password:
+            if not _SMTP_CFG.username or not _SMTP_CFG.password:
                 logger.warning("SMTP credentials not configured, skipping email send")
                 return
             
             # Create message
             msg = MIMEMultipart()
-            msg['From'] = smtp_username
+            msg['From'] = _SMTP_CFG.username
             msg['To'] = email
-            msg['Subject'] = "Password Reset Request - Student Feedback System"
+            msg['Subject'] = _RESET_SUBJECT
             
             # Email body
-            reset_url = f"{os.environ.get('FRONTEND_URL', 'http://localhost:3000')}/reset-password?token={token}"
-            body = f"""
-            You have requested a password reset for your account.
-            
-            Click the link below to reset your password:
-            {reset_url}
-            
-            This link will expire in 1 hour.
-            
-            If you did not request this password reset, please ignore this email.
-            
-            Best regards,
-            Student Feedback System Team
-            """
+            reset_url = f"{_SMTP_CFG.frontend_url}/reset-password?token={token}"
+            body = _RESET_BODY_TMPL.substitute(reset_url=reset_url)
             
             msg.attach(MIMEText(body, 'plain'))
             
-            # Send email
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(smtp_username, smtp_password)
-            text = msg.as_string()
-            server.sendmail(smtp_username, email, text)
-            server.quit()
+            # Send email without blocking the event loop on the TLS handshake and login
+            await aiosmtplib.send(
+                msg,
+                hostname=_SMTP_CFG.server,
+                port=_SMTP_CFG.port,
+                start_tls=True,
+                username=_SMTP_CFG.username,
+                password=_SMTP_CFG.password
+            )
             
             logger.info(f"Password reset email sent to {email}")
             
@@ -336,6 +564,11 @@ class AuthHelpers:
         """Initialize default admin accounts (HOD and Principal)"""
         import uuid
         
+        # Optionally size the bcrypt cost to this machine instead of using BCRYPT_ROUNDS
+        target_ms = os.environ.get("BCRYPT_TARGET_MS")
+        if target_ms:
+            calibrate_bcrypt_rounds(float(target_ms))
+        
         admins_to_create = [
             {
                 "username": "hod_cse",
@@ -355,25 +588,17 @@ class AuthHelpers:
             }
         ]
         
-        for admin_data in admins_to_create:
-            try:
-                logger.info(f"Initializing admin account: {admin_data['username']}")
-                
-                # Delete existing admin if exists
-                await DatabaseOperations.delete_one(
-                    "admins",
-                    {"username": admin_data["username"]}
-                )
-                
-                # Create new admin with proper password handling
-                password = admin_data["password"]
-                logger.info(f"Password length: {len(password.encode('utf-8'))} bytes")
-                
-                logger.info(f"Attempting to hash password for {admin_data['username']}")
-                password_hash = AuthService.get_password_hash(password)
-                logger.info(f"Password hashed successfully for {admin_data['username']}")
-                
-                admin_doc = {
+        usernames = [admin_data["username"] for admin_data in admins_to_create]
+        try:
+            logger.info(f"Initializing admin accounts: {', '.join(usernames)}")
+            
+            # Hash all passwords concurrently on the bcrypt pool
+            password_hashes = await asyncio.gather(
+                *(ahash_password(admin_data["password"]) for admin_data in admins_to_create)
+            )
+            
+            admin_docs = [
+                {
                     "id": str(uuid.uuid4()),  # Generate UUID for id field
                     "username": admin_data["username"],
                     "password_hash": password_hash,
@@ -382,13 +607,19 @@ class AuthHelpers:
                     "email": admin_data.get("email"),
                     "phone": admin_data.get("phone")
                 }
-                
-                await DatabaseOperations.insert_one("admins", admin_doc)
-                logger.info(f"Created admin account: {admin_data['username']} with ID: {admin_doc['id']}")
-                print(f"Created admin account: {admin_data['username']} with ID: {admin_doc['id']}")
-            except Exception as e:
-                logger.error(f"Error creating admin {admin_data['username']}: {e}")
-                print(f"Error creating admin {admin_data['username']}: {e}")
+                for admin_data, password_hash in zip(admins_to_create, password_hashes)
+            ]
+            
+            # Replace any existing accounts in one delete and one insert
+            await DatabaseOperations.delete_many("admins", {"username": {"$in": usernames}})
+            await DatabaseOperations.insert_many("admins", admin_docs)
+            
+            for admin_doc in admin_docs:
+                logger.info(f"Created admin account: {admin_doc['username']} with ID: {admin_doc['id']}")
+                print(f"Created admin account: {admin_doc['username']} with ID: {admin_doc['id']}")
+        except Exception as e:
+            logger.error(f"Error creating admin accounts: {e}")
+            print(f"Error creating admin accounts: {e}")
     
     @staticmethod
     def create_user_response(user_data: Dict[str, Any], role: str) -> Dict[str, Any]:
@@ -2,15 +2,22 @@
 Automated report generation and delivery system
 """
 import asyncio
+import copy
+import itertools
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-import json
-import redis
-from celery import Celery
+import msgspec
+from croniter import croniter
+import redis.asyncio as redis
+from celery import Celery, group
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 import os
 
 logger = logging.getLogger(__name__)
@@ -38,11 +45,11 @@ class ReportSchedule:
     frequency: ReportFrequency
     cron_expression: Optional[str] = None
     timezone: str = "UTC"
-    recipients: List[str] = None
-    parameters: Dict[str, Any] = None
+    recipients: Optional[List[str]] = None
+    parameters: Optional[Dict[str, Any]] = None
     status: ReportStatus = ReportStatus.ACTIVE
-    created_at: datetime = None
-    updated_at: datetime = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
     created_by: str = ""
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
@@ -59,13 +66,109 @@ class ReportDelivery:
     status: str
     sent_at: Optional[datetime] = None
     error_message: Optional[str] = None
-    recipients: List[str] = None
+    recipients: Optional[List[str]] = None
+
+# msgpack codecs for the Redis payloads; decoding restores enums and datetimes
+_encoder = msgspec.msgpack.Encoder()
+_schedule_decoder = msgspec.msgpack.Decoder(ReportSchedule)
+
+# Large listings are decoded in chunks off the event loop
+_DECODE_CHUNK = 256
+_decoder_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="schedule-decode")
+
+def _decode_schedules(payloads: List[bytes]) -> List[ReportSchedule]:
+    """Decode a batch of stored schedules"""
+    return [_schedule_decoder.decode(data) for data in payloads]
+
+# Sorted set of active schedule ids scored by next_run, so a tick only loads due schedules
+_SCHEDULE_DUE_KEY = "report_schedule:due"
+# Bumped on every schedule write so cached listings know when they are stale
+_SCHEDULE_VERSION_KEY = "report_schedule:version"
+# Schedules also drop out when their TTL lapses, which bumps no version, so a listing is
+# only reused for this many seconds
+_SCHEDULE_SNAPSHOT_TTL = 60
+# Set of every stored schedule id, so listing never has to walk the keyspace
+_SCHEDULE_INDEX_KEY = "report_schedule:index"
+# Running run/success/failure totals and a set of schedule ids per status, for O(1) stats
+_SCHEDULE_STATS_KEY = "report_schedule:stats"
+
+def _status_key(status: ReportStatus) -> str:
+    """Key of the set holding the ids of schedules with a given status"""
+    return f"report_schedule:by_status:{status.value}"
+
+def _creator_key(created_by: str) -> str:
+    """Key of the set holding the ids of schedules created by a given user"""
+    return f"report_schedule:by_creator:{created_by}"
+
+# Fixed interval for every frequency except CUSTOM, which follows its cron expression
+_FREQ_DELTA = {
+    ReportFrequency.DAILY: timedelta(days=1),
+    ReportFrequency.WEEKLY: timedelta(weeks=1),
+    ReportFrequency.MONTHLY: timedelta(days=30),
+    ReportFrequency.QUARTERLY: timedelta(days=90),
+    ReportFrequency.YEARLY: timedelta(days=365)
+}
+_DEFAULT_DELTA = timedelta(hours=1)
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _utc_score(dt: datetime) -> float:
+    """Epoch seconds for a naive UTC datetime"""
+    return (dt - _EPOCH).total_seconds()
+
+# Ids are a millisecond-seeded counter plus the pid, unique across processes and restarts
+_id_counter = itertools.count(int(time.time() * 1000))
+
+def _gen_id(prefix: str) -> str:
+    """Generate a unique id for a schedule, delivery or report"""
+    return f"{prefix}_{next(_id_counter):x}_{os.getpid():x}"
+
+# One connection pool per Redis URL, shared by every manager in the process
+_connection_pools: Dict[str, redis.ConnectionPool] = {}
+
+def _get_connection_pool(redis_url: str) -> redis.ConnectionPool:
+    """Get the shared connection pool for a Redis URL, creating it on first use"""
+    pool = _connection_pools.get(redis_url)
+    if pool is None:
+        pool = redis.ConnectionPool.from_url(redis_url, max_connections=50)
+        _connection_pools[redis_url] = pool
+    return pool
+
+# One event loop per worker process, run on a background thread so every task shares
+# it and the pooled Redis connections stay open between tasks
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get this process's task event loop, starting it on first use"""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="report-tasks-loop", daemon=True).start()
+            _worker_loop = loop
+    return _worker_loop
+
+@worker_process_init.connect
+def _start_worker_loop(**kwargs):
+    """Give each forked worker a loop and connections of its own"""
+    global _worker_loop, _worker_loop_lock
+    # Whatever came over from the parent process belongs to threads that don't exist here
+    _worker_loop = None
+    _worker_loop_lock = threading.Lock()
+    for pool in _connection_pools.values():
+        pool.reset()
+    _get_worker_loop()
 
 class AutomatedReportManager:
     """Manager for automated report generation and delivery"""
     
     def __init__(self, redis_url: str = None):
-        self.redis_client = redis.from_url(redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379'))
+        self.redis_client = redis.Redis(
+            connection_pool=_get_connection_pool(
+                redis_url or os.environ.get('REDIS_URL', 'redis://localhost:6379')
+            )
+        )
         
         # Celery app for scheduled tasks
         self.celery_app = Celery(
@@ -76,15 +179,37 @@ class AutomatedReportManager:
         
         # Configure Celery
         self.celery_app.conf.update(
-            task_serializer='json',
-            accept_content=['json'],
-            result_serializer='json',
+            task_serializer='msgpack',
+            accept_content=['msgpack', 'json'],  # json still accepted during rolling upgrades
+            result_serializer='msgpack',
+            broker_transport_options={'visibility_timeout': 3600},
+            broker_connection_retry_on_startup=True,
+            broker_pool_limit=10,
+            redis_max_connections=20,
+            task_acks_late=True,
+            worker_prefetch_multiplier=1,
+            # Report generation waits mostly on Redis, Mongo and mail delivery, so it gets
+            # its own queue for a green-thread pool, e.g.
+            #   celery -A automated_reports worker -Q reports_io -P eventlet -c 50
+            # while the scheduling tasks stay on the default prefork queue
+            task_routes={'generate_automated_report': {'queue': 'reports_io'}},
             timezone='UTC',
             enable_utc=True,
             beat_schedule=self._get_beat_schedule(),
             beat_schedule_filename='celerybeat-schedule'
         )
         
+        # Last full schedule listing as (version, schedules sorted newest first)
+        self._schedules_snapshot: Optional[Tuple[Optional[bytes], List[ReportSchedule]]] = None
+        self._schedules_snapshot_expires = 0.0
+        
+        # Report generator and template manager, created on first use and reused
+        self._generator = None
+        self._template_manager = None
+        
+        # Parsed cron expressions, so CUSTOM schedules are only parsed once
+        self._cron_cache: Dict[str, croniter] = {}
+        
         # Register tasks
         self._register_tasks()
     
@@ -111,22 +236,26 @@ class AutomatedReportManager:
         @self.celery_app.task
         def check_scheduled_reports():
             """Check for scheduled reports that need to be generated"""
-            asyncio.run(self._check_scheduled_reports())
+            self._run(self._check_scheduled_reports())
         
         @self.celery_app.task
         def cleanup_old_reports():
             """Clean up old reports and deliveries"""
-            asyncio.run(self._cleanup_old_reports())
+            self._run(self._cleanup_old_reports())
         
         @self.celery_app.task
         def send_report_reminders():
             """Send reminders for upcoming report deadlines"""
-            asyncio.run(self._send_report_reminders())
+            self._run(self._send_report_reminders())
         
         @self.celery_app.task
         def generate_automated_report(schedule_id: str):
             """Generate a specific automated report"""
-            asyncio.run(self._generate_automated_report(schedule_id))
+            self._run(self._generate_automated_report(schedule_id))
+    
+    def _run(self, coro):
+        """Run a task coroutine on the worker's event loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
     
     async def create_schedule(
         self,
@@ -142,7 +271,7 @@ class AutomatedReportManager:
     ) -> str:
         """Create a new report schedule"""
         try:
-            schedule_id = f"schedule_{int(datetime.utcnow().timestamp())}"
+            schedule_id = _gen_id("schedule")
             
             # Calculate next run time
             next_run = self._calculate_next_run(frequency, cron_expression, timezone)
@@ -220,7 +349,7 @@ class AutomatedReportManager:
             # This would be implemented with Celery task cancellation
             
             # Delete schedule
-            await self._delete_schedule(schedule_id)
+            await self._delete_schedule(schedule)
             
             logger.info(f"Report schedule deleted: {schedule_id}")
             return True
@@ -250,47 +379,91 @@ class AutomatedReportManager:
     ) -> List[ReportSchedule]:
         """List report schedules with filters"""
         try:
-            # Get all schedule IDs
-            pattern = "report_schedule:*"
-            keys = self.redis_client.keys(pattern)
-            
-            schedules = []
-            for key in keys:
-                schedule_data = self.redis_client.get(key)
-                if schedule_data:
-                    schedule_dict = json.loads(schedule_data)
-                    schedule = ReportSchedule(**schedule_dict)
-                    
-                    # Apply filters
-                    if status and schedule.status != status:
-                        continue
-                    if created_by and schedule.created_by != created_by:
-                        continue
-                    
-                    schedules.append(schedule)
-            
-            # Sort by created_at descending
-            schedules.sort(key=lambda x: x.created_at, reverse=True)
-            
-            # Apply pagination
-            return schedules[offset:offset + limit]
+            # Reuse the last listing until some schedule is written
+            version = await self.redis_client.get(_SCHEDULE_VERSION_KEY)
+            if (
+                self._schedules_snapshot is not None
+                and self._schedules_snapshot[0] == version
+                and time.monotonic() < self._schedules_snapshot_expires
+            ):
+                schedules = self._schedules_snapshot[1]
+            elif status or created_by:
+                # Intersect the filter indexes and load only the matching schedules
+                index_keys = []
+                if status:
+                    index_keys.append(_status_key(status))
+                if created_by:
+                    index_keys.append(_creator_key(created_by))
+                ids = await self.redis_client.sinter(index_keys)
+                schedules = await self._load_schedules(ids, index_keys)
+                schedules.sort(key=lambda x: x.created_at, reverse=True)
+            else:
+                ids = await self.redis_client.smembers(_SCHEDULE_INDEX_KEY)
+                schedules = await self._load_schedules(ids, [_SCHEDULE_INDEX_KEY])
+                
+                # Sort by created_at descending
+                schedules.sort(key=lambda x: x.created_at, reverse=True)
+                self._schedules_snapshot = (version, schedules)
+                self._schedules_snapshot_expires = time.monotonic() + _SCHEDULE_SNAPSHOT_TTL
+            
+            # Apply filters
+            schedules = [
+                schedule for schedule in schedules
+                if (not status or schedule.status == status)
+                and (not created_by or schedule.created_by == created_by)
+            ]
+            
+            # Apply pagination; hand out copies so callers can't alter the cached listing
+            return [copy.deepcopy(schedule) for schedule in schedules[offset:offset + limit]]
             
         except Exception as e:
             logger.error(f"List schedules error: {e}")
             return []
     
+    async def _load_schedules(self, ids, index_keys: List[str]) -> List[ReportSchedule]:
+        """Fetch and decode schedules by id, pruning ids that have expired from the given indexes"""
+        ids = [schedule_id.decode() for schedule_id in ids]
+        if not ids:
+            return []
+        
+        # Fetch every schedule in one round trip
+        payloads = await self.redis_client.mget([f"report_schedule:{schedule_id}" for schedule_id in ids])
+        
+        expired = [schedule_id for schedule_id, data in zip(ids, payloads) if not data]
+        if expired:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for index_key in index_keys:
+                pipe.srem(index_key, *expired)
+            await pipe.execute()
+        
+        payloads = [data for data in payloads if data]
+        if len(payloads) <= _DECODE_CHUNK:
+            return _decode_schedules(payloads)
+        
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(_decoder_pool, _decode_schedules, payloads[i:i + _DECODE_CHUNK])
+            for i in range(0, len(payloads), _DECODE_CHUNK)
+        ))
+        return [schedule for chunk in chunks for schedule in chunk]
+    
     async def get_schedule_stats(self) -> Dict[str, Any]:
         """Get statistics for report schedules"""
         try:
-            schedules = await self.list_schedules()
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.hgetall(_SCHEDULE_STATS_KEY)
+            for status in ReportStatus:
+                pipe.scard(_status_key(status))
+            counters, *status_counts = await pipe.execute()
+            schedules_by_status = dict(zip(ReportStatus, status_counts))
             
-            total_schedules = len(schedules)
-            active_schedules = len([s for s in schedules if s.status == ReportStatus.ACTIVE])
-            paused_schedules = len([s for s in schedules if s.status == ReportStatus.PAUSED])
+            total_schedules = sum(status_counts)
+            active_schedules = schedules_by_status[ReportStatus.ACTIVE]
+            paused_schedules = schedules_by_status[ReportStatus.PAUSED]
             
-            total_runs = sum(s.run_count for s in schedules)
-            total_successes = sum(s.success_count for s in schedules)
-            total_failures = sum(s.failure_count for s in schedules)
+            total_runs = int(counters.get(b"total_runs", 0))
+            total_successes = int(counters.get(b"total_successes", 0))
+            total_failures = int(counters.get(b"total_failures", 0))
             
             success_rate = (total_successes / total_runs * 100) if total_runs > 0 else 0
             
@@ -313,17 +486,26 @@ class AutomatedReportManager:
         try:
             now = datetime.utcnow()
             
-            # Get all active schedules
-            schedules = await self.list_schedules(status=ReportStatus.ACTIVE)
+            # Only load the schedules whose next_run has passed
+            due_ids = await self.redis_client.zrangebyscore(_SCHEDULE_DUE_KEY, "-inf", _utc_score(now))
+            if not due_ids:
+                return
             
-            for schedule in schedules:
-                if schedule.next_run and schedule.next_run <= now:
-                    # Schedule report generation
-                    self.celery_app.send_task(
-                        'generate_automated_report',
-                        args=[schedule.id]
-                    )
-                    
+            values = await self.redis_client.mget([b"report_schedule:" + schedule_id for schedule_id in due_ids])
+            stale_ids = [schedule_id for schedule_id, data in zip(due_ids, values) if not data]
+            if stale_ids:
+                # The schedule itself expired; drop it from the due and status indexes
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.zrem(_SCHEDULE_DUE_KEY, *stale_ids)
+                pipe.srem(_status_key(ReportStatus.ACTIVE), *stale_ids)
+                await pipe.execute()
+            
+            due_schedules = []
+            for data in values:
+                if not data:
+                    continue
+                schedule = _schedule_decoder.decode(data)
+                if schedule.status == ReportStatus.ACTIVE and schedule.next_run and schedule.next_run <= now:
                     # Update next run time
                     schedule.next_run = self._calculate_next_run(
                         schedule.frequency,
@@ -331,9 +513,23 @@ class AutomatedReportManager:
                         schedule.timezone
                     )
                     schedule.last_run = now
-                    
-                    await self._store_schedule(schedule)
-                    
+                    due_schedules.append(schedule)
+            
+            if not due_schedules:
+                return
+            
+            # Write every rescheduled entry in one round trip before the workers read them
+            pipe = self.redis_client.pipeline(transaction=False)
+            for schedule in due_schedules:
+                self._queue_schedule_write(pipe, schedule)
+            await pipe.execute()
+            
+            # Schedule report generation as one group instead of a send per schedule
+            group(
+                self.celery_app.signature('generate_automated_report', args=[schedule.id])
+                for schedule in due_schedules
+            ).apply_async()
+            
         except Exception as e:
             logger.error(f"Check scheduled reports error: {e}")
     
@@ -350,11 +546,8 @@ class AutomatedReportManager:
             
             try:
                 # Generate report
-                from report_generator import ReportGenerator
-                from report_templates import ReportTemplateManager
-                
-                generator = ReportGenerator()
-                template_manager = ReportTemplateManager()
+                generator = self._get_generator()
+                template_manager = self._get_template_manager()
                 
                 template = template_manager.get_template(schedule.template_id)
                 if not template:
@@ -379,21 +572,42 @@ class AutomatedReportManager:
                 if delivery_success:
                     schedule.success_count += 1
                     schedule.last_error = None
+                    outcome = "total_successes"
                 else:
                     schedule.failure_count += 1
                     schedule.last_error = "Delivery failed"
+                    outcome = "total_failures"
                 
             except Exception as e:
                 schedule.failure_count += 1
                 schedule.last_error = str(e)
+                outcome = "total_failures"
                 logger.error(f"Report generation failed for {schedule_id}: {e}")
             
-            # Update schedule
-            await self._store_schedule(schedule)
+            # Update schedule and the running totals together
+            pipe = self.redis_client.pipeline()
+            self._queue_schedule_write(pipe, schedule)
+            pipe.hincrby(_SCHEDULE_STATS_KEY, "total_runs", 1)
+            pipe.hincrby(_SCHEDULE_STATS_KEY, outcome, 1)
+            await pipe.execute()
             
         except Exception as e:
             logger.error(f"Generate automated report error: {e}")
     
+    def _get_generator(self):
+        """Get the shared ReportGenerator, creating it on first use"""
+        if self._generator is None:
+            from report_generator import ReportGenerator
+            self._generator = ReportGenerator()
+        return self._generator
+    
+    def _get_template_manager(self):
+        """Get the shared ReportTemplateManager, creating it on first use"""
+        if self._template_manager is None:
+            from report_templates import ReportTemplateManager
+            self._template_manager = ReportTemplateManager()
+        return self._template_manager
+    
     async def _deliver_report(
         self,
         schedule: ReportSchedule,
@@ -402,38 +616,42 @@ class AutomatedReportManager:
     ) -> bool:
         """Deliver report to recipients"""
         try:
-            from notification_service import NotificationService, NotificationRecipient
+            from notification_service import NotificationService, NotificationType
             
             notification_service = NotificationService()
             
             # Create delivery record
             delivery = ReportDelivery(
-                id=f"delivery_{int(datetime.utcnow().timestamp())}",
+                id=_gen_id("delivery"),
                 schedule_id=schedule.id,
                 report_id=report_id,
                 status="pending",
                 recipients=schedule.recipients
             )
             
-            # Send notifications
-            recipients = []
-            for email in schedule.recipients:
-                recipients.append(NotificationRecipient(
-                    user_id="",
-                    email=email,
-                    name="",
-                    preferences={}
-                ))
+            # One message to every recipient instead of a send per address
+            result = await notification_service.send_bulk(
+                NotificationType.REPORT_READY,
+                [{"email": email} for email in schedule.recipients or []],
+                {
+                    'name': "Recipient",
+                    'report_type': schedule.name,
+                    'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M'),
+                    'download_link': f"/api/feedback/reports/download/{report_id}"
+                }
+            )
             
-            # This would be implemented with actual email delivery
-            # For now, just log the delivery
-            logger.info(f"Report delivered to {len(recipients)} recipients")
+            logger.info(f"Report delivered to {result['total_sent']} recipients")
             
-            delivery.status = "sent"
-            delivery.sent_at = datetime.utcnow()
+            if result['total_sent']:
+                delivery.status = "sent"
+                delivery.sent_at = datetime.utcnow()
+            else:
+                delivery.status = "failed"
+                delivery.error_message = "No recipients accepted the report"
             
             await self._store_delivery(delivery)
-            return True
+            return delivery.status == "sent"
             
         except Exception as e:
             logger.error(f"Report delivery error: {e}")
@@ -471,45 +689,73 @@ class AutomatedReportManager:
         """Calculate next run time for a schedule"""
         now = datetime.utcnow()
         
-        if frequency == ReportFrequency.DAILY:
-            return now + timedelta(days=1)
-        elif frequency == ReportFrequency.WEEKLY:
-            return now + timedelta(weeks=1)
-        elif frequency == ReportFrequency.MONTHLY:
-            return now + timedelta(days=30)
-        elif frequency == ReportFrequency.QUARTERLY:
-            return now + timedelta(days=90)
-        elif frequency == ReportFrequency.YEARLY:
-            return now + timedelta(days=365)
-        elif frequency == ReportFrequency.CUSTOM and cron_expression:
-            # This would be implemented with cron parsing
-            return now + timedelta(hours=1)
+        delta = _FREQ_DELTA.get(frequency)
+        if delta is not None:
+            return now + delta
+        if frequency == ReportFrequency.CUSTOM and cron_expression:
+            return self._get_cron(cron_expression, now).get_next(datetime)
+        return now + _DEFAULT_DELTA
+    
+    def _get_cron(self, cron_expression: str, base: datetime) -> croniter:
+        """Get the parsed iterator for a cron expression, positioned at base"""
+        cron = self._cron_cache.get(cron_expression)
+        if cron is None:
+            cron = croniter(cron_expression, base)
+            self._cron_cache[cron_expression] = cron
         else:
-            return now + timedelta(hours=1)
+            cron.set_current(base, force=True)
+        return cron
     
     async def _store_schedule(self, schedule: ReportSchedule):
         """Store schedule in Redis"""
+        pipe = self.redis_client.pipeline()
+        self._queue_schedule_write(pipe, schedule)
+        await pipe.execute()
+    
+    def _queue_schedule_write(self, pipe, schedule: ReportSchedule):
+        """Queue a schedule and its index entries on a Redis pipeline"""
         key = f"report_schedule:{schedule.id}"
-        data = json.dumps(schedule.__dict__, default=str)
-        self.redis_client.set(key, data, ex=86400 * 30)  # 30 days TTL
+        pipe.set(key, _encoder.encode(schedule), ex=86400 * 30)  # 30 days TTL
+        pipe.sadd(_SCHEDULE_INDEX_KEY, schedule.id)
+        pipe.sadd(_creator_key(schedule.created_by), schedule.id)
+        for status in ReportStatus:
+            if status == schedule.status:
+                pipe.sadd(_status_key(status), schedule.id)
+            else:
+                pipe.srem(_status_key(status), schedule.id)
+        if schedule.status == ReportStatus.ACTIVE and schedule.next_run:
+            pipe.zadd(_SCHEDULE_DUE_KEY, {schedule.id: _utc_score(schedule.next_run)})
+        else:
+            pipe.zrem(_SCHEDULE_DUE_KEY, schedule.id)
+        pipe.incr(_SCHEDULE_VERSION_KEY)
     
     async def _get_schedule(self, schedule_id: str) -> Optional[ReportSchedule]:
         """Get schedule from Redis"""
         key = f"report_schedule:{schedule_id}"
-        data = self.redis_client.get(key)
+        data = await self.redis_client.get(key)
         if data:
-            schedule_dict = json.loads(data)
-            return ReportSchedule(**schedule_dict)
+            return _schedule_decoder.decode(data)
         return None
     
-    async def _delete_schedule(self, schedule_id: str):
+    async def _delete_schedule(self, schedule: ReportSchedule):
         """Delete schedule from Redis"""
-        key = f"report_schedule:{schedule_id}"
-        self.redis_client.delete(key)
+        key = f"report_schedule:{schedule.id}"
+        pipe = self.redis_client.pipeline()
+        pipe.delete(key)
+        pipe.srem(_SCHEDULE_INDEX_KEY, schedule.id)
+        pipe.srem(_creator_key(schedule.created_by), schedule.id)
+        pipe.zrem(_SCHEDULE_DUE_KEY, schedule.id)
+        pipe.srem(_status_key(schedule.status), schedule.id)
+        # Take the schedule's runs out of the totals, as the old full scan would have
+        pipe.hincrby(_SCHEDULE_STATS_KEY, "total_runs", -schedule.run_count)
+        pipe.hincrby(_SCHEDULE_STATS_KEY, "total_successes", -schedule.success_count)
+        pipe.hincrby(_SCHEDULE_STATS_KEY, "total_failures", -schedule.failure_count)
+        pipe.incr(_SCHEDULE_VERSION_KEY)
+        await pipe.execute()
     
     async def _store_report(self, schedule: ReportSchedule, content: bytes) -> str:
         """Store generated report"""
-        report_id = f"report_{int(datetime.utcnow().timestamp())}"
+        report_id = _gen_id("report")
         # This would be implemented with actual storage
         logger.info(f"Report stored: {report_id}")
         return report_id
@@ -517,8 +763,8 @@ class AutomatedReportManager:
     async def _store_delivery(self, delivery: ReportDelivery):
         """Store delivery record"""
         key = f"report_delivery:{delivery.id}"
-        data = json.dumps(delivery.__dict__, default=str)
-        self.redis_client.set(key, data, ex=86400 * 7)  # 7 days TTL
+        data = _encoder.encode(delivery)
+        await self.redis_client.set(key, data, ex=86400 * 7)  # 7 days TTL
     
     async def _cleanup_old_reports(self):
         """Clean up old reports and deliveries"""
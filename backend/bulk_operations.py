@@ -1,13 +1,30 @@
 """
 Bulk operations utilities for API endpoints
 """
+import asyncio
 from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from operator import itemgetter
 from pydantic import BaseModel
 from fastapi import HTTPException, status
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Large creates are split into batches written concurrently, a few at a time
+_BULK_CHUNK_SIZE = 500
+_BULK_CONCURRENCY = 4
+
+def _as_update_document(update_data: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """Build an update document the way DatabaseOperations.update_one does"""
+    if any(key.startswith('$') for key in update_data):
+        if '$set' in update_data:
+            return {**update_data, '$set': {**update_data['$set'], 'updated_at': now}}
+        return update_data
+    return {"$set": {**update_data, "updated_at": now}}
+
 class BulkOperationResult(BaseModel):
     """Result of a bulk operation"""
     success: bool
@@ -48,6 +65,8 @@ class BulkOperationsHelper:
             errors=[]
         )
         
+        # Validate everything first so the inserts can go out as one batch
+        valid = []
         for i, item in enumerate(items):
             try:
                 # Validate item if validation function provided
@@ -62,12 +81,10 @@ class BulkOperationsHelper:
                         result.failed += 1
                         continue
                 
-                # Create item
-                await DatabaseOperations.insert_one(collection, item)
-                result.successful += 1
+                valid.append((i, item))
                 
             except Exception as e:
-                logger.error(f"Bulk create error for item {i}: {e}")
+                logger.error("Bulk create error for item %s: %s", i, e)
                 result.errors.append({
                     "index": i,
                     "item": item,
@@ -75,6 +92,53 @@ class BulkOperationsHelper:
                 })
                 result.failed += 1
         
+        if valid:
+            now = datetime.now(timezone.utc)
+            semaphore = asyncio.Semaphore(_BULK_CONCURRENCY)
+            
+            async def insert_chunk(chunk):
+                """Insert one batch, returning its inserted items and failed items"""
+                operations = [
+                    InsertOne({**item, "created_at": now, "updated_at": now})
+                    for _, item in chunk
+                ]
+                async with semaphore:
+                    try:
+                        await DatabaseOperations.bulk_write(collection, operations)
+                        return [item for _, item in chunk], []
+                    except BulkWriteError as e:
+                        # Unordered writes carry on past failures; map each one back to its item
+                        errors = {
+                            write_error["index"]: write_error["errmsg"]
+                            for write_error in e.details.get("writeErrors", [])
+                        }
+                        inserted = [item for position, (_, item) in enumerate(chunk) if position not in errors]
+                        return inserted, [(chunk[position], error) for position, error in errors.items()]
+                    except Exception as e:
+                        logger.error("Bulk create error: %s", e)
+                        return [], [(entry, str(e)) for entry in chunk]
+            
+            chunks = [
+                valid[start:start + _BULK_CHUNK_SIZE]
+                for start in range(0, len(valid), _BULK_CHUNK_SIZE)
+            ]
+            inserted_items = []
+            for inserted, failed in await asyncio.gather(*(insert_chunk(chunk) for chunk in chunks)):
+                result.successful += len(inserted)
+                inserted_items.extend(inserted)
+                for (i, item), error in failed:
+                    logger.error("Bulk create error for item %s: %s", i, error)
+                    result.errors.append({
+                        "index": i,
+                        "item": item,
+                        "error": error
+                    })
+                result.failed += len(failed)
+            
+            result.errors.sort(key=itemgetter("index"))
+            if inserted_items:
+                await DatabaseOperations.track_inserted(collection, inserted_items)
+        
         result.success = result.failed == 0
         return result
     
@@ -95,6 +159,8 @@ class BulkOperationsHelper:
             errors=[]
         )
         
+        # Validate everything first so the updates can go out as one batch
+        valid = []
         for i, update in enumerate(updates):
             try:
                 item_id = update.get("id")
@@ -121,25 +187,10 @@ class BulkOperationsHelper:
                         result.failed += 1
                         continue
                 
-                # Update item
-                update_result = await DatabaseOperations.update_one(
-                    collection,
-                    {"id": item_id},
-                    update_data
-                )
-                
-                if update_result.modified_count > 0:
-                    result.successful += 1
-                else:
-                    result.errors.append({
-                        "index": i,
-                        "update": update,
-                        "error": "Item not found or no changes made"
-                    })
-                    result.failed += 1
+                valid.append((i, update))
                 
             except Exception as e:
-                logger.error(f"Bulk update error for item {i}: {e}")
+                logger.error("Bulk update error for item %s: %s", i, e)
                 result.errors.append({
                     "index": i,
                     "update": update,
@@ -147,6 +198,54 @@ class BulkOperationsHelper:
                 })
                 result.failed += 1
         
+        if valid:
+            now = datetime.now(timezone.utc)
+            operations = [
+                UpdateOne({"id": update["id"]}, _as_update_document(update.get("data", {}), now))
+                for _, update in valid
+            ]
+            
+            failed_writes = {}
+            try:
+                write_result = await DatabaseOperations.bulk_write(collection, operations)
+                matched = write_result.matched_count
+            except BulkWriteError as e:
+                matched = e.details.get("nMatched", 0)
+                failed_writes = {
+                    write_error["index"]: write_error["errmsg"]
+                    for write_error in e.details.get("writeErrors", [])
+                }
+            except Exception as e:
+                logger.error("Bulk update error: %s", e)
+                matched = 0
+                failed_writes = {position: str(e) for position in range(len(valid))}
+            
+            # Every update stamps updated_at, so an update only changes nothing when no
+            # document matched; look up which ids exist only when that happened
+            not_found = set()
+            if matched + len(failed_writes) < len(valid):
+                ids = [update["id"] for _, update in valid]
+                not_found = set(ids) - set(await DatabaseOperations.distinct(collection, "id", {"id": {"$in": ids}}))
+            
+            for position, (i, update) in enumerate(valid):
+                if position in failed_writes:
+                    logger.error("Bulk update error for item %s: %s", i, failed_writes[position])
+                    error = failed_writes[position]
+                elif update["id"] in not_found:
+                    error = "Item not found or no changes made"
+                else:
+                    result.successful += 1
+                    continue
+                
+                result.errors.append({
+                    "index": i,
+                    "update": update,
+                    "error": error
+                })
+                result.failed += 1
+            
+            result.errors.sort(key=itemgetter("index"))
+        
         result.success = result.failed == 0
         return result
     
@@ -158,7 +257,6 @@ class BulkOperationsHelper:
     ) -> BulkOperationResult:
         """Perform bulk delete operation"""
         from database import DatabaseOperations
-        from enhanced_database import EnhancedDatabaseOperations
         
         result = BulkOperationResult(
             success=True,
@@ -168,32 +266,41 @@ class BulkOperationsHelper:
             errors=[]
         )
         
-        for i, item_id in enumerate(ids):
-            try:
+        if not ids:
+            return result
+        
+        try:
+            # One lookup finds which ids exist, then one write removes them all
+            existing = set(await DatabaseOperations.distinct(collection, "id", {"id": {"$in": ids}}))
+            if existing:
                 if soft_delete:
                     # Soft delete
-                    success = await EnhancedDatabaseOperations.soft_delete(collection, item_id)
+                    await DatabaseOperations.update_many(
+                        collection,
+                        {"id": {"$in": list(existing)}},
+                        {"is_active": False, "deleted_at": datetime.utcnow()}
+                    )
                 else:
                     # Hard delete
-                    delete_result = await DatabaseOperations.delete_one(collection, {"id": item_id})
-                    success = delete_result.deleted_count > 0
-                
-                if success:
-                    result.successful += 1
-                else:
-                    result.errors.append({
-                        "index": i,
-                        "id": item_id,
-                        "error": "Item not found"
-                    })
-                    result.failed += 1
-                
-            except Exception as e:
-                logger.error(f"Bulk delete error for item {i}: {e}")
+                    await DatabaseOperations.delete_many(collection, {"id": {"$in": list(existing)}})
+        except Exception as e:
+            logger.error("Bulk delete error: %s", e)
+            result.errors = [
+                {"index": i, "id": item_id, "error": str(e)}
+                for i, item_id in enumerate(ids)
+            ]
+            result.failed = len(ids)
+            result.success = False
+            return result
+        
+        for i, item_id in enumerate(ids):
+            if item_id in existing:
+                result.successful += 1
+            else:
                 result.errors.append({
                     "index": i,
                     "id": item_id,
-                    "error": str(e)
+                    "error": "Item not found"
                 })
                 result.failed += 1
         
@@ -208,18 +315,34 @@ class BulkOperationsHelper:
         validate_func: Optional[callable] = None
     ) -> BulkOperationResult:
         """Import data from CSV string"""
-        import pandas as pd
-        import io
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
         
         try:
-            # Parse CSV
-            df = pd.read_csv(io.StringIO(csv_data))
+            data = csv_data.encode()
+            read_options = pacsv.ReadOptions(block_size=1 << 20)
+            
+            # Column types are inferred from the first block; read just that to find
+            # date-like columns, so they can be kept as the text they were in the file
+            schema = pacsv.open_csv(pa.BufferReader(data), read_options=read_options).schema
+            text_columns = {
+                field.name: pa.string()
+                for field in schema
+                if pa.types.is_temporal(field.type)
+            }
+            
+            # Parse CSV in pyarrow's C reader
+            table = pacsv.read_csv(
+                pa.BufferReader(data),
+                read_options=read_options,
+                convert_options=pacsv.ConvertOptions(column_types=text_columns)
+            )
             
             # Map columns
-            df = df.rename(columns=field_mapping)
+            table = table.rename_columns([field_mapping.get(name, name) for name in table.column_names])
             
             # Convert to list of dictionaries
-            items = df.to_dict('records')
+            items = table.to_pylist()
             
             # Perform bulk create
             return await BulkOperationsHelper.bulk_create(
@@ -227,7 +350,7 @@ class BulkOperationsHelper:
             )
             
         except Exception as e:
-            logger.error(f"CSV import error: {e}")
+            logger.error("CSV import error: %s", e)
             return BulkOperationResult(
                 success=False,
                 processed=0,
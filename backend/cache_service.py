@@ -1,20 +1,107 @@
 """
 Redis caching service for performance optimization
 """
+import hashlib
 import json
 import pickle
 import os
-from typing import Any, Optional, Union, Dict, List
+import time
+from typing import Any, Optional, Union, Dict, List, Tuple
 from datetime import datetime, timedelta
+from fnmatch import fnmatchcase
+from itertools import islice
 import asyncio
 import logging
 from functools import wraps
 
+import msgpack
+import orjson
 import redis.asyncio as redis
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 logger = logging.getLogger(__name__)
 
+# Process-local copies of get_or_set values sit in front of Redis for a short while.
+# They are kept serialized and decoded per hit, so callers never share one object
+_LOCAL_CACHE_TTL = 30
+_LOCAL_CACHE_MAX_SIZE = 1024
+# Written and deleted keys and patterns are announced here so every worker drops its local copies
+_INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Running totals kept in hashes only change once seeded, which is recorded in a marker
+# field; increments never create a hash, so every hash carries the expiry set when seeding
+_INCREMENT_MARKED_LUA = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+for i = 2, #ARGV, 2 do
+    redis.call('HINCRBYFLOAT', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+_SEED_UNMARKED_LUA = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('HSET', KEYS[1], ARGV[1], 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if #KEYS > 1 then
+    -- The index outlives every hash it lists, as each seed restarts its expiry
+    redis.call('SADD', KEYS[2], KEYS[1])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+return 1
+"""
+_DELETE_INDEXED_LUA = """
+local keys = redis.call('SMEMBERS', KEYS[1])
+keys[#keys + 1] = KEYS[1]
+return redis.call('UNLINK', unpack(keys))
+"""
+
+
+# Every stored value starts with a one-byte tag naming its format, so reads can
+# dispatch on it instead of trying one decoder after another
+_JSON_TAG = b"J"
+_MSGPACK_TAG = b"M"
+_PICKLE_TAG = b"P"
+# Pickles from protocol 2 on open with the PROTO opcode
+_PICKLE_PROTO = b"\x80"
+
+
+def _serialize(value: Any, serialize_method: str) -> bytes:
+    """Encode a value for Redis, tagged with its format"""
+    if serialize_method == "json":
+        return _JSON_TAG + orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    if serialize_method == "pickle":
+        return _PICKLE_TAG + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return _MSGPACK_TAG + msgpack.packb(value, use_bin_type=True, datetime=True, default=str)
+
+
+def _deserialize(value: bytes) -> Any:
+    """Decode a value read from Redis"""
+    tag = value[:1]
+    if tag == _JSON_TAG:
+        return orjson.loads(value[1:])
+    if tag == _MSGPACK_TAG:
+        return msgpack.unpackb(value[1:], raw=False, timestamp=3)
+    if tag == _PICKLE_TAG:
+        return pickle.loads(value[1:])
+    
+    # Untagged values predate the format tags and expire on their own
+    if tag == _PICKLE_PROTO:
+        return pickle.loads(value)
+    return json.loads(value)
+
+
+async def _call(func, *args, **kwargs) -> Any:
+    """Call a plain or coroutine function and return its result"""
+    if asyncio.iscoroutinefunction(func):
+        return await func(*args, **kwargs)
+    return func(*args, **kwargs)
+
 
 class CacheService:
     """Redis-based caching service with advanced features"""
@@ -23,6 +110,9 @@ class CacheService:
         self.redis_url = redis_url
         self.redis_client: Optional[redis.Redis] = None
         self._connection_pool = None
+        self._local: Dict[str, Tuple[float, bytes]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._invalidation_task: Optional[asyncio.Task] = None
         
     async def connect(self):
         """Initialize Redis connection with connection pooling"""
@@ -36,6 +126,7 @@ class CacheService:
             )
             self.redis_client = redis.Redis(connection_pool=self._connection_pool)
             await self.redis_client.ping()
+            self._invalidation_task = asyncio.create_task(self._listen_for_invalidations())
             logger.info("Redis connection established successfully")
         except Exception as e:
             logger.warning(f"Failed to connect to Redis: {e}. Continuing without cache.")
@@ -48,26 +139,76 @@ class CacheService:
     
     async def disconnect(self):
         """Close Redis connection"""
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
         if self.redis_client:
             await self.redis_client.close()
         if self._connection_pool:
             await self._connection_pool.disconnect()
     
+    def _get_local(self, key: str) -> Optional[bytes]:
+        """Get a serialized value from the process-local cache"""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() < expires_at:
+            return value
+        self._local.pop(key, None)
+        return None
+    
+    def _set_local(self, key: str, value: bytes, expire: Optional[int] = None):
+        """Keep a serialized value in the process-local cache, never longer than its Redis expiry"""
+        if len(self._local) >= _LOCAL_CACHE_MAX_SIZE:
+            # Evict the oldest tenth rather than tracking recency per hit
+            for stale_key in list(islice(self._local, _LOCAL_CACHE_MAX_SIZE // 10)):
+                del self._local[stale_key]
+        ttl = min(expire, _LOCAL_CACHE_TTL) if expire else _LOCAL_CACHE_TTL
+        self._local[key] = (time.monotonic() + ttl, value)
+    
+    def _evict_local(self, pattern: str):
+        """Drop process-local copies of keys matching a Redis glob pattern"""
+        for key in [key for key in self._local if fnmatchcase(key, pattern)]:
+            del self._local[key]
+    
+    async def _listen_for_invalidations(self):
+        """Drop local copies of keys any worker writes or deletes"""
+        pubsub = self.redis_client.pubsub()
+        try:
+            await pubsub.subscribe(_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._evict_local(message["data"].decode())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener stopped: {e}")
+        finally:
+            await pubsub.aclose()
+    
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
+        value = await self._get_raw(key)
+        if value is None:
+            return None
+        return await self._decode(key, value)
+    
+    async def _decode(self, key: str, value: bytes) -> Optional[Any]:
+        """Decode a cached value, dropping the key if it can't be read"""
+        try:
+            return _deserialize(value)
+        except Exception as e:
+            logger.error(f"Error decoding cache key {key}: {e}")
+            await self.delete(key)
+            return None
+    
+    async def _get_raw(self, key: str) -> Optional[bytes]:
+        """Get a value from cache without decoding it"""
         if not self.is_connected():
             return None
             
         try:
-            value = await self.redis_client.get(key)
-            if value is None:
-                return None
-            
-            # Try to deserialize as JSON first, then pickle
-            try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
-                return pickle.loads(value)
+            return await self.redis_client.get(key)
         except Exception as e:
             logger.error(f"Error getting cache key {key}: {e}")
             return None
@@ -80,49 +221,120 @@ class CacheService:
         serialize_method: str = "json"
     ) -> bool:
         """Set value in cache with optional expiration"""
+        self._local.pop(key, None)
         if not self.is_connected():
             return True
             
         try:
-            # Serialize value
-            if serialize_method == "json":
-                serialized_value = json.dumps(value, default=str)
-            else:
-                serialized_value = pickle.dumps(value)
+            serialized_value = _serialize(value, serialize_method)
+        except Exception as e:
+            logger.error(f"Error setting cache key {key}: {e}")
+            return False
+        return await self._set_raw(key, serialized_value, expire)
+    
+    async def _set_raw(self, key: str, serialized_value: bytes, expire: Optional[int] = None) -> bool:
+        """Store an already serialized value and tell other workers to drop their copies"""
+        self._local.pop(key, None)
+        if not self.is_connected():
+            return True
             
-            # Set with expiration
-            if expire:
-                await self.redis_client.setex(key, expire, serialized_value)
-            else:
-                await self.redis_client.set(key, serialized_value)
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                # Set with expiration
+                if expire:
+                    pipe.setex(key, expire, serialized_value)
+                else:
+                    pipe.set(key, serialized_value)
+                pipe.publish(_INVALIDATION_CHANNEL, key)
+                await pipe.execute()
             
             return True
         except Exception as e:
             logger.error(f"Error setting cache key {key}: {e}")
             return False
     
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        expire: Optional[int] = None,
+        serialize_method: str = "json"
+    ) -> bool:
+        """Set several values in one round trip"""
+        for key in items:
+            self._local.pop(key, None)
+        if not self.is_connected():
+            return True
+            
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    serialized_value = _serialize(value, serialize_method)
+                    if expire:
+                        pipe.setex(key, expire, serialized_value)
+                    else:
+                        pipe.set(key, serialized_value)
+                    pipe.publish(_INVALIDATION_CHANNEL, key)
+                await pipe.execute()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Error setting cache keys {list(items)}: {e}")
+            return False
+    
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
+        self._local.pop(key, None)
         if not self.is_connected():
             return True
             
         try:
-            result = await self.redis_client.delete(key)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(key)
+                pipe.publish(_INVALIDATION_CHANNEL, key)
+                result, _ = await pipe.execute()
             return result > 0
         except Exception as e:
             logger.error(f"Error deleting cache key {key}: {e}")
             return False
     
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys in one round trip"""
+        for key in keys:
+            self._local.pop(key, None)
+        if not self.is_connected() or not keys:
+            return 0
+            
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.delete(key)
+                    pipe.publish(_INVALIDATION_CHANNEL, key)
+                return sum((await pipe.execute())[::2])
+        except Exception as e:
+            logger.error(f"Error deleting cache keys {keys}: {e}")
+            return 0
+    
     async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching pattern"""
+        self._evict_local(pattern)
         try:
             if not self.redis_client:
                 return 0
             
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                return await self.redis_client.delete(*keys)
-            return 0
+            await self.redis_client.publish(_INVALIDATION_CHANNEL, pattern)
+            
+            # Walk the keyspace incrementally instead of blocking Redis with KEYS, and
+            # UNLINK each batch of matches so Redis frees the memory in the background
+            deleted = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.error(f"Error deleting pattern {pattern}: {e}")
             return 0
@@ -148,27 +360,69 @@ class CacheService:
     ) -> Any:
         """Get value from cache or compute and cache it"""
         try:
+            # Serve hot keys from this process before going to Redis
+            cached_value = self._get_local(key)
+            if cached_value is not None:
+                value = await self._decode(key, cached_value)
+                if value is not None:
+                    return value
+            
             # Try to get from cache first
-            cached_value = await self.get(key)
+            cached_value = await self._get_raw(key)
             if cached_value is not None:
-                return cached_value
+                value = await self._decode(key, cached_value)
+                if value is not None:
+                    self._set_local(key, cached_value, expire)
+                    return value
             
-            # Compute value if not in cache
-            if asyncio.iscoroutinefunction(func):
-                value = await func(*args, **kwargs)
-            else:
-                value = func(*args, **kwargs)
+            # Concurrent misses on the same key wait for the one computation in flight,
+            # each decoding its own copy of the result
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                # If the shared computation fails, the fallback below computes this
+                # caller's value itself
+                try:
+                    return _deserialize(await asyncio.shield(inflight))
+                except asyncio.CancelledError:
+                    # Only this caller's own cancellation propagates
+                    if not inflight.cancelled():
+                        raise
+                    raise RuntimeError(f"Computation of cache key {key} was cancelled")
             
-            # Cache the computed value
-            await self.set(key, value, expire)
-            return value
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight[key] = inflight
+            try:
+                # Compute value if not in cache
+                value = await _call(func, *args, **kwargs)
+                
+                # Cache the computed value, or just return it if it can't be encoded
+                try:
+                    serialized_value = _serialize(value, "json")
+                except Exception as e:
+                    logger.error(f"Error setting cache key {key}: {e}")
+                    inflight.set_exception(e)
+                    inflight.exception()
+                    return value
+                await self._set_raw(key, serialized_value, expire)
+                self._set_local(key, serialized_value, expire)
+                inflight.set_result(serialized_value)
+                return value
+            except Exception as e:
+                inflight.set_exception(e)
+                # Mark it retrieved so a failure nobody waited on isn't logged again
+                inflight.exception()
+                raise
+            finally:
+                if not inflight.done():
+                    # This task was cancelled; fail the waiters with an ordinary error
+                    # so they compute for themselves rather than being cancelled too
+                    inflight.set_exception(RuntimeError(f"Computation of cache key {key} was cancelled"))
+                    inflight.exception()
+                self._inflight.pop(key, None)
         except Exception as e:
             logger.error(f"Error in get_or_set for key {key}: {e}")
             # Fallback to computing without caching
-            if asyncio.iscoroutinefunction(func):
-                return await func(*args, **kwargs)
-            else:
-                return func(*args, **kwargs)
+            return await _call(func, *args, **kwargs)
     
     async def increment(self, key: str, amount: int = 1, expire: Optional[int] = None) -> int:
         """Increment counter in cache"""
@@ -184,6 +438,72 @@ class CacheService:
             logger.error(f"Error incrementing key {key}: {e}")
             return 0
     
+    async def increment_fields(self, increments: Dict[str, Dict[str, float]], marker: str) -> bool:
+        """Add to numeric hash fields across several keys, skipping hashes without the marker field"""
+        if not self.is_connected():
+            return True
+            
+        try:
+            script = self.redis_client.register_script(_INCREMENT_MARKED_LUA)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, fields in increments.items():
+                    args = [marker]
+                    for field, amount in fields.items():
+                        args.extend((field, amount))
+                    await script(keys=[key], args=args, client=pipe)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error incrementing fields of {list(increments)}: {e}")
+            return False
+    
+    async def get_fields(self, key: str) -> Dict[str, str]:
+        """Get every field of a hash"""
+        if not self.is_connected():
+            return {}
+            
+        try:
+            fields = await self.redis_client.hgetall(key)
+            return {field.decode(): value.decode() for field, value in fields.items()}
+        except Exception as e:
+            logger.error(f"Error getting fields of {key}: {e}")
+            return {}
+    
+    async def seed_fields(
+        self,
+        key: str,
+        fields: Dict[str, Any],
+        marker: str,
+        expire: int,
+        index_key: Optional[str] = None
+    ) -> bool:
+        """Write hash fields plus the marker unless already marked, listing the key in index_key"""
+        if not self.is_connected():
+            return True
+            
+        try:
+            args = [marker, expire]
+            for field, value in fields.items():
+                args.extend((field, value))
+            script = self.redis_client.register_script(_SEED_UNMARKED_LUA)
+            keys = [key, index_key] if index_key else [key]
+            return bool(await script(keys=keys, args=args))
+        except Exception as e:
+            logger.error(f"Error seeding fields of {key}: {e}")
+            return False
+    
+    async def delete_indexed(self, index_key: str) -> int:
+        """Delete every key listed in the set at index_key, and the set itself"""
+        if not self.is_connected():
+            return 0
+            
+        try:
+            script = self.redis_client.register_script(_DELETE_INDEXED_LUA)
+            return await script(keys=[index_key])
+        except Exception as e:
+            logger.error(f"Error deleting keys indexed by {index_key}: {e}")
+            return 0
+    
     async def get_stats(self) -> Dict[str, Any]:
         """Get Redis cache statistics"""
         try:
@@ -206,28 +526,22 @@ class CacheService:
 
 
 def cache_key(*args, **kwargs) -> str:
-    """Generate cache key from arguments"""
-    key_parts = []
+    """Generate a fixed-width cache key from arguments"""
+    digest = hashlib.blake2b(digest_size=8)
     
-    # Add positional arguments
+    # Add positional arguments; objects with an id are keyed by it
     for arg in args:
-        if isinstance(arg, (str, int, float, bool)):
-            key_parts.append(str(arg))
-        elif hasattr(arg, 'id'):
-            key_parts.append(str(arg.id))
-        else:
-            key_parts.append(str(arg))
+        digest.update(repr(getattr(arg, 'id', arg)).encode())
+        digest.update(b"\x1f")
     
     # Add keyword arguments
     for key, value in sorted(kwargs.items()):
-        if isinstance(value, (str, int, float, bool)):
-            key_parts.append(f"{key}:{value}")
-        elif hasattr(value, 'id'):
-            key_parts.append(f"{key}:{value.id}")
-        else:
-            key_parts.append(f"{key}:{str(value)}")
-    
-    return ":".join(key_parts)
+        digest.update(key.encode())
+        digest.update(b"=")
+        digest.update(repr(getattr(value, 'id', value)).encode())
+        digest.update(b"\x1f")
+    
+    return digest.hexdigest()
 
 
 def cached(
@@ -269,6 +583,37 @@ def cached(
     return decorator
 
 
+# Static aggregation stages for the stats queries; only the $match stage varies per call
+_STUDENT_STATS_GROUP = {"$group": {
+    "_id": None,
+    "total": {"$sum": 1},
+    "sections": {"$addToSet": "$section"},
+    "batches": {"$addToSet": "$batch_year"}
+}}
+
+# Subjects are lists per faculty, so they are unwound in their own facet to leave the total intact
+_FACULTY_STATS_FACET = {"$facet": {
+    "totals": [{"$group": {
+        "_id": None,
+        "total": {"$sum": 1},
+        "departments": {"$addToSet": "$department"}
+    }}],
+    "subjects": [
+        {"$unwind": "$subjects"},
+        {"$group": {"_id": None, "subjects": {"$addToSet": "$subjects"}}}
+    ]
+}}
+
+_FEEDBACK_STATS_GROUP = {"$group": {
+    "_id": None,
+    "total_submissions": {"$sum": 1},
+    "sections": {"$addToSet": "$student_section"},
+    "semesters": {"$addToSet": "$semester"},
+    "academic_years": {"$addToSet": "$academic_year"},
+    "avg_ratings": {"$avg": "$faculty_feedbacks.ratings"}
+}}
+
+
 class DatabaseCacheService:
     """Database-specific caching service with query optimization"""
     
@@ -283,12 +628,7 @@ class DatabaseCacheService:
         async def compute_stats():
             pipeline = [
                 {"$match": {"is_active": True, **({"section": section} if section else {})}},
-                {"$group": {
-                    "_id": None,
-                    "total": {"$sum": 1},
-                    "by_section": {"$push": "$section"},
-                    "by_batch": {"$push": "$batch_year"}
-                }}
+                _STUDENT_STATS_GROUP
             ]
             
             result = await self.db.students.aggregate(pipeline).to_list(1)
@@ -296,8 +636,8 @@ class DatabaseCacheService:
                 stats = result[0]
                 return {
                     "total_students": stats["total"],
-                    "sections": list(set(stats["by_section"])),
-                    "batches": list(set(stats["by_batch"]))
+                    "sections": stats["sections"],
+                    "batches": stats["batches"]
                 }
             return {"total_students": 0, "sections": [], "batches": []}
         
@@ -310,27 +650,21 @@ class DatabaseCacheService:
         async def compute_stats():
             pipeline = [
                 {"$match": {"is_active": True, **({"department": department} if department else {})}},
-                {"$group": {
-                    "_id": None,
-                    "total": {"$sum": 1},
-                    "by_department": {"$push": "$department"},
-                    "subjects": {"$push": "$subjects"}
-                }}
+                _FACULTY_STATS_FACET
             ]
             
             result = await self.db.faculty.aggregate(pipeline).to_list(1)
-            if result:
-                stats = result[0]
-                all_subjects = []
-                for subject_list in stats["subjects"]:
-                    all_subjects.extend(subject_list)
-                
+            if result and result[0]["totals"]:
+                stats = result[0]["totals"][0]
+                subjects = result[0]["subjects"]
                 return {
                     "total_faculty": stats["total"],
-                    "departments": list(set(stats["by_department"])),
-                    "subjects": list(set(all_subjects))
+                    "departments": stats["departments"],
+                    "subjects": subjects[0]["subjects"] if subjects else []
                 }
             return {"total_faculty": 0, "departments": [], "subjects": []}
+        
+        return await self.cache.get_or_set(cache_key_str, compute_stats, expire=300)
     
     async def get_feedback_stats(
         self, 
@@ -349,14 +683,7 @@ class DatabaseCacheService:
             
             pipeline = [
                 {"$match": match_filter},
-                {"$group": {
-                    "_id": None,
-                    "total_submissions": {"$sum": 1},
-                    "by_section": {"$push": "$student_section"},
-                    "by_semester": {"$push": "$semester"},
-                    "by_year": {"$push": "$academic_year"},
-                    "avg_ratings": {"$avg": "$faculty_feedbacks.ratings"}
-                }}
+                _FEEDBACK_STATS_GROUP
             ]
             
             result = await self.db.feedback_submissions.aggregate(pipeline).to_list(1)
@@ -364,10 +691,10 @@ class DatabaseCacheService:
                 stats = result[0]
                 return {
                     "total_submissions": stats["total_submissions"],
-                    "sections": list(set(stats["by_section"])),
-                    "semesters": list(set(stats["by_semester"])),
-                    "academic_years": list(set(stats["by_year"])),
-                    "average_rating": round(stats.get("avg_ratings", 0), 2)
+                    "sections": stats["sections"],
+                    "semesters": stats["semesters"],
+                    "academic_years": stats["academic_years"],
+                    "average_rating": round(stats.get("avg_ratings") or 0, 2)
                 }
             return {
                 "total_submissions": 0,
@@ -381,20 +708,17 @@ class DatabaseCacheService:
     
     async def invalidate_student_cache(self, section: Optional[str] = None):
         """Invalidate student-related cache"""
-        if section:
-            await self.cache.delete(f"student_stats:{section}")
+        # The pattern covers the section-specific key as well
         await self.cache.delete_pattern("student_stats:*")
     
     async def invalidate_faculty_cache(self, department: Optional[str] = None):
         """Invalidate faculty-related cache"""
-        if department:
-            await self.cache.delete(f"faculty_stats:{department}")
+        # The pattern covers the department-specific key as well
         await self.cache.delete_pattern("faculty_stats:*")
     
     async def invalidate_feedback_cache(self, semester: Optional[str] = None, academic_year: Optional[str] = None):
         """Invalidate feedback-related cache"""
-        if semester and academic_year:
-            await self.cache.delete(f"feedback_stats:{semester}:{academic_year}")
+        # The pattern covers the semester-specific key as well
         await self.cache.delete_pattern("feedback_stats:*")
 
 
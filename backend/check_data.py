@@ -24,30 +24,38 @@ async def check_data():
         print("✅ Connected to MongoDB")
         
         # Check collections
-        students = await DatabaseOperations.find_many('students', {})
-        faculty = await DatabaseOperations.find_many('faculty', {})
-        feedback = await DatabaseOperations.find_many('feedback_submissions', {})
+        students_count = await DatabaseOperations.count_documents('students')
+        faculty_count = await DatabaseOperations.count_documents('faculty')
+        feedback_count = await DatabaseOperations.count_documents('feedback_submissions')
         
         print(f"\n📊 Database Summary:")
-        print(f"   Students in DB: {len(students)}")
-        print(f"   Faculty in DB: {len(faculty)}")
-        print(f"   Feedback submissions in DB: {len(feedback)}")
+        print(f"   Students in DB: {students_count}")
+        print(f"   Faculty in DB: {faculty_count}")
+        print(f"   Feedback submissions in DB: {feedback_count}")
         
         # Check sections
-        section_a = await DatabaseOperations.find_many('students', {'section': 'A'})
-        section_b = await DatabaseOperations.find_many('students', {'section': 'B'})
+        section_a = await DatabaseOperations.count_documents('students', {'section': 'A'})
+        section_b = await DatabaseOperations.count_documents('students', {'section': 'B'})
         print(f"\n📋 Section Distribution:")
-        print(f"   Section A students: {len(section_a)}")
-        print(f"   Section B students: {len(section_b)}")
+        print(f"   Section A students: {section_a}")
+        print(f"   Section B students: {section_b}")
         
         # Show some student details
+        students = await DatabaseOperations.find_many(
+            'students', {}, limit=5,
+            projection={'_id': 0, 'name': 1, 'reg_number': 1, 'section': 1}
+        )
         print(f"\n👨‍🎓 Student Details:")
-        for i, student in enumerate(students[:5]):
+        for i, student in enumerate(students):
             print(f"   {i+1}. {student['name']} ({student['reg_number']}) - Section {student['section']}")
         
         # Show faculty details
+        faculty = await DatabaseOperations.find_many(
+            'faculty', {}, limit=5,
+            projection={'_id': 0, 'name': 1, 'faculty_id': 1, 'subjects': 1}
+        )
         print(f"\n👩‍🏫 Faculty Details:")
-        for i, fac in enumerate(faculty[:5]):
+        for i, fac in enumerate(faculty):
             print(f"   {i+1}. {fac['name']} ({fac['faculty_id']}) - {', '.join(fac['subjects'])}")
         
     except Exception as e:
@@ -1,6 +1,7 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import InsertOne
 import os
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 import logging
 from datetime import datetime, timedelta, timezone
 
@@ -46,6 +47,12 @@ async def create_indexes():
     """Create database indexes for optimal performance"""
     db = get_database()
     
+    # Created on its own so a failure elsewhere can't leave expired reset tokens unpurged
+    try:
+        await db.password_reset_tokens.create_index("expires_at", expireAfterSeconds=0)
+    except Exception as e:
+        logger.error(f"Error creating password reset token TTL index: {e}")
+    
     try:
         # Student indexes
         await db.students.create_index("reg_number", unique=True)
@@ -65,6 +72,15 @@ async def create_indexes():
         # Admin indexes
         await db.admins.create_index("username", unique=True)
         await db.admins.create_index("role")
+        await db.admins.create_index("email")
+        
+        # Tokens stored before reset tokens were hashed have no token_hash; leave them
+        # out of the unique index so they don't collide as nulls
+        await db.password_reset_tokens.create_index(
+            "token_hash",
+            unique=True,
+            partialFilterExpression={"token_hash": {"$exists": True}}
+        )
         
         logger.info("Database indexes created successfully")
     except Exception as e:
@@ -72,6 +88,19 @@ async def create_indexes():
         logger.warning("Continuing without some indexes")
         # Don't raise - allow application to continue
 
+# Running feedback totals per department and overall, kept in Redis as submissions are
+# inserted so the dashboard needn't aggregate them. Any other write to the submissions
+# drops them to be recounted; a write racing a recount can leave them off until they
+# expire, which is no longer than the dashboard used to cache its aggregation
+_FEEDBACK_TOTALS_TTL = 300
+# Set of the totals keys seeded so far, so a change can drop them without scanning
+_FEEDBACK_TOTALS_INDEX = "counter:feedback_totals"
+_FEEDBACK_TOTALS_MARKER = "seeded"
+
+def _feedback_totals_key(department: Optional[str]) -> str:
+    """Key of the running feedback totals for a department, or for all departments"""
+    return f"counter:feedback:{department or 'all'}"
+
 # Database utility functions
 class DatabaseOperations:
     
@@ -84,10 +113,11 @@ class DatabaseOperations:
     @staticmethod
     async def find_many(collection: str, filter_dict: Dict[str, Any] = None, 
                        skip: Optional[int] = None, limit: Optional[int] = None, 
-                       sort: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+                       sort: Optional[Dict[str, int]] = None,
+                       projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Find multiple documents in collection with pagination and sorting"""
         db = get_database()
-        cursor = db[collection].find(filter_dict or {})
+        cursor = db[collection].find(filter_dict or {}, projection)
         
         if sort:
             cursor = cursor.sort(list(sort.items()))
@@ -98,6 +128,15 @@ class DatabaseOperations:
             
         return await cursor.to_list(length=limit)
     
+    @staticmethod
+    async def find_iter(collection: str, filter_dict: Dict[str, Any] = None,
+                        batch_size: int = 500,
+                        projection: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream matching documents a batch at a time instead of loading them all"""
+        db = get_database()
+        async for document in db[collection].find(filter_dict or {}, projection).batch_size(batch_size):
+            yield document
+    
     @staticmethod
     async def insert_one(collection: str, document: Dict[str, Any]) -> str:
         """Insert one document and return id"""
@@ -106,6 +145,7 @@ class DatabaseOperations:
         document['created_at'] = now
         document['updated_at'] = now
         result = await db[collection].insert_one(document)
+        await DatabaseOperations.track_inserted(collection, [document])
         return str(result.inserted_id)
     
     @staticmethod
@@ -117,8 +157,40 @@ class DatabaseOperations:
             doc['created_at'] = now
             doc['updated_at'] = now
         result = await db[collection].insert_many(documents)
+        await DatabaseOperations.track_inserted(collection, documents)
         return [str(id) for id in result.inserted_ids]
     
+    @staticmethod
+    async def track_inserted(collection: str, documents: List[Dict[str, Any]]):
+        """Feed inserted documents into the cache's running counters"""
+        if collection == "feedback_submissions":
+            from cache_service import cache_service
+            
+            increments = {}
+            for document in documents:
+                # Mirror the dashboard, which only counts active submissions
+                if document.get("is_active") is not True:
+                    continue
+                ratings = [
+                    feedback["overall_rating"]
+                    for feedback in document.get("faculty_feedbacks", [])
+                    if feedback.get("overall_rating") is not None
+                ]
+                for key in {_feedback_totals_key(None), _feedback_totals_key(document.get("department"))}:
+                    totals = increments.setdefault(key, {"submissions": 0, "rating_sum": 0, "rating_count": 0})
+                    totals["submissions"] += 1
+                    totals["rating_sum"] += sum(ratings)
+                    totals["rating_count"] += len(ratings)
+            if increments:
+                await cache_service.increment_fields(increments, _FEEDBACK_TOTALS_MARKER)
+    
+    @staticmethod
+    async def track_changed(collection: str):
+        """Drop running counters that a write other than an insert may have made stale"""
+        if collection == "feedback_submissions":
+            from cache_service import cache_service
+            await cache_service.delete_indexed(_FEEDBACK_TOTALS_INDEX)
+    
     @staticmethod
     async def update_one(collection: str, filter_dict: Dict[str, Any], 
                         update_dict: Dict[str, Any]) -> bool:
@@ -139,15 +211,62 @@ class DatabaseOperations:
             update_dict['updated_at'] = datetime.now(timezone.utc)
             result = await db[collection].update_one(filter_dict, {"$set": update_dict})
         
+        await DatabaseOperations.track_changed(collection)
         return result.modified_count > 0
     
+    @staticmethod
+    async def find_one_and_update(collection: str, filter_dict: Dict[str, Any],
+                                  update_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Atomically update one document and return it as it was before the update"""
+        db = get_database()
+        update_dict['updated_at'] = datetime.now(timezone.utc)
+        document = await db[collection].find_one_and_update(filter_dict, {"$set": update_dict})
+        await DatabaseOperations.track_changed(collection)
+        return document
+    
     @staticmethod
     async def delete_one(collection: str, filter_dict: Dict[str, Any]) -> bool:
         """Delete one document"""
         db = get_database()
         result = await db[collection].delete_one(filter_dict)
+        await DatabaseOperations.track_changed(collection)
         return result.deleted_count > 0
     
+    @staticmethod
+    async def delete_many(collection: str, filter_dict: Dict[str, Any]) -> int:
+        """Delete matching documents and return how many were removed"""
+        db = get_database()
+        result = await db[collection].delete_many(filter_dict)
+        await DatabaseOperations.track_changed(collection)
+        return result.deleted_count
+    
+    @staticmethod
+    async def update_many(collection: str, filter_dict: Dict[str, Any],
+                          update_dict: Dict[str, Any]) -> int:
+        """Update matching documents and return how many matched"""
+        db = get_database()
+        update_dict['updated_at'] = datetime.now(timezone.utc)
+        result = await db[collection].update_many(filter_dict, {"$set": update_dict})
+        await DatabaseOperations.track_changed(collection)
+        return result.matched_count
+    
+    @staticmethod
+    async def bulk_write(collection: str, operations: List[Any], ordered: bool = False):
+        """Send a batch of write operations in one command and return the BulkWriteResult"""
+        db = get_database()
+        try:
+            return await db[collection].bulk_write(operations, ordered=ordered)
+        finally:
+            # Callers track the documents they insert themselves
+            if not all(isinstance(operation, InsertOne) for operation in operations):
+                await DatabaseOperations.track_changed(collection)
+    
+    @staticmethod
+    async def distinct(collection: str, field: str, filter_dict: Dict[str, Any] = None) -> List[Any]:
+        """Distinct values of a field among matching documents"""
+        db = get_database()
+        return await db[collection].distinct(field, filter_dict or {})
+    
     @staticmethod
     async def count_documents(collection: str, filter_dict: Dict[str, Any] = None) -> int:
         """Count documents in collection"""
@@ -200,49 +319,55 @@ class DatabaseOperations:
             # If no operators, wrap with $set
             update_operation = {"$set": {**update_dict, "updated_at": datetime.now(timezone.utc)}}
         
-        # First try custom id field
-        result = await db[collection].update_one({"id": document_id}, update_operation)
-        if result.modified_count > 0:
-            return True
-        
-        # If not found and looks like ObjectId, try _id
-        if len(document_id) == 24 and document_id.replace('-', '').replace('_', '').isalnum():
+        try:
+            # First try custom id field
+            result = await db[collection].update_one({"id": document_id}, update_operation)
+            if result.modified_count > 0:
+                return True
+            
+            # If not found and looks like ObjectId, try _id
+            if len(document_id) == 24 and document_id.replace('-', '').replace('_', '').isalnum():
+                try:
+                    from bson import ObjectId
+                    result = await db[collection].update_one({"_id": ObjectId(document_id)}, update_operation)
+                    return result.modified_count > 0
+                except Exception:
+                    pass
+            
+            # For UUIDs, try direct _id lookup (some UUIDs might be stored as _id)
             try:
-                from bson import ObjectId
-                result = await db[collection].update_one({"_id": ObjectId(document_id)}, update_operation)
+                result = await db[collection].update_one({"_id": document_id}, update_operation)
                 return result.modified_count > 0
             except Exception:
                 pass
-        
-        # For UUIDs, try direct _id lookup (some UUIDs might be stored as _id)
-        try:
-            result = await db[collection].update_one({"_id": document_id}, update_operation)
-            return result.modified_count > 0
-        except Exception:
-            pass
-        
-        return False
+            
+            return False
+        finally:
+            await DatabaseOperations.track_changed(collection)
     
     @staticmethod
     async def delete_by_id(collection: str, document_id: str) -> bool:
         """Delete document by ID, trying both custom id and MongoDB _id"""
         db = get_database()
         
-        # First try custom id field
-        result = await db[collection].delete_one({"id": document_id})
-        if result.deleted_count > 0:
-            return True
-        
-        # If not found and looks like ObjectId, try _id
-        if len(document_id) == 24 and document_id.replace('-', '').replace('_', '').isalnum():
-            try:
-                from bson import ObjectId
-                result = await db[collection].delete_one({"_id": ObjectId(document_id)})
-                return result.deleted_count > 0
-            except Exception:
-                pass
-        
-        return False
+        try:
+            # First try custom id field
+            result = await db[collection].delete_one({"id": document_id})
+            if result.deleted_count > 0:
+                return True
+            
+            # If not found and looks like ObjectId, try _id
+            if len(document_id) == 24 and document_id.replace('-', '').replace('_', '').isalnum():
+                try:
+                    from bson import ObjectId
+                    result = await db[collection].delete_one({"_id": ObjectId(document_id)})
+                    return result.deleted_count > 0
+                except Exception:
+                    pass
+            
+            return False
+        finally:
+            await DatabaseOperations.track_changed(collection)
 
 # Analytics helper functions
 class AnalyticsOperations:
@@ -288,11 +413,60 @@ class AnalyticsOperations:
         if department_filter:
             match_conditions.update(department_filter)
         
-        # Get total feedback submissions
-        total_submissions = await DatabaseOperations.count_documents(
-            "feedback_submissions", 
-            match_conditions
-        )
+        # Feedback totals come from the running counters when the filter is one they track
+        use_counters = not department_filter or list(department_filter) == ["department"]
+        totals_key = _feedback_totals_key((department_filter or {}).get("department"))
+        totals = {}
+        if use_counters:
+            from cache_service import cache_service
+            totals = await cache_service.get_fields(totals_key)
+        
+        if _FEEDBACK_TOTALS_MARKER in totals:
+            total_submissions = int(float(totals["submissions"]))
+            rating_sum = float(totals["rating_sum"])
+            rating_count = int(float(totals["rating_count"]))
+        else:
+            # Get total feedback submissions
+            total_submissions = await DatabaseOperations.count_documents(
+                "feedback_submissions", 
+                match_conditions
+            )
+            
+            # Get the rating total and count across all feedback
+            rating_pipeline = [
+                {"$match": match_conditions},
+                {"$unwind": "$faculty_feedbacks"},
+                {"$group": {
+                    "_id": None,
+                    "rating_sum": {"$sum": "$faculty_feedbacks.overall_rating"},
+                    "rating_count": {"$sum": {"$cond": [
+                        {"$ifNull": ["$faculty_feedbacks.overall_rating", False]}, 1, 0
+                    ]}}
+                }}
+            ]
+            
+            try:
+                rating_result = await DatabaseOperations.aggregate("feedback_submissions", rating_pipeline)
+                if rating_result:
+                    rating_sum = rating_result[0]["rating_sum"]
+                    rating_count = rating_result[0]["rating_count"]
+                else:
+                    rating_sum, rating_count = 0, 0
+            except Exception as e:
+                logger.warning(f"Error calculating average rating: {e}")
+                rating_sum, rating_count = 0, 0
+                use_counters = False
+            
+            # Seeding only writes totals nobody has seeded yet, so it can't overwrite
+            # submissions another worker has counted in since
+            if use_counters:
+                await cache_service.seed_fields(totals_key, {
+                    "submissions": total_submissions,
+                    "rating_sum": rating_sum,
+                    "rating_count": rating_count
+                }, _FEEDBACK_TOTALS_MARKER, _FEEDBACK_TOTALS_TTL, _FEEDBACK_TOTALS_INDEX)
+        
+        avg_rating = rating_sum / rating_count if rating_count else 0
         
         # Get total students in department
         student_match = {"is_active": True}
@@ -304,27 +478,6 @@ class AnalyticsOperations:
             student_match
         )
         
-        # Get average rating across all feedback
-        avg_rating_pipeline = [
-            {"$match": match_conditions},
-            {"$unwind": "$faculty_feedbacks"},
-            {"$group": {
-                "_id": None,
-                "average_rating": {"$avg": "$faculty_feedbacks.overall_rating"},
-                "total_ratings": {"$sum": 1}
-            }}
-        ]
-        
-        try:
-            avg_rating_result = await DatabaseOperations.aggregate("feedback_submissions", avg_rating_pipeline)
-            if avg_rating_result and len(avg_rating_result) > 0 and avg_rating_result[0].get("average_rating") is not None:
-                avg_rating = avg_rating_result[0]["average_rating"]
-            else:
-                avg_rating = 0
-        except Exception as e:
-            logger.warning(f"Error calculating average rating: {e}")
-            avg_rating = 0
-        
         # Get batch year distribution with error handling
         try:
             batch_year_pipeline = [
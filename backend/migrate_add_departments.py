@@ -153,10 +153,12 @@ async def migrate_data():
                 print(f"Batch year already exists: {batch['year_range']} {batch['department']}")
         
         # Update existing students with default department and batch year
-        students = await DatabaseOperations.find_many("students", {"is_active": True})
         updated_students = 0
         
-        for student in students:
+        async for student in DatabaseOperations.find_iter(
+            "students", {"is_active": True},
+            projection={"_id": 0, "id": 1, "department": 1, "batch_year": 1}
+        ):
             update_data = {}
             if not student.get("department"):
                 update_data["department"] = "CSE"  # Default to CSE
@@ -174,10 +176,12 @@ async def migrate_data():
         print(f"Updated {updated_students} students with department and batch year")
         
         # Update existing faculty with default department
-        faculty = await DatabaseOperations.find_many("faculty", {"is_active": True})
         updated_faculty = 0
         
-        for member in faculty:
+        async for member in DatabaseOperations.find_iter(
+            "faculty", {"is_active": True},
+            projection={"_id": 0, "id": 1, "department": 1}
+        ):
             if not member.get("department"):
                 await DatabaseOperations.update_one(
                     "faculty",
@@ -3,6 +3,7 @@ Notification service for feedback system
 """
 import smtplib
 import logging
+import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
@@ -202,24 +203,7 @@ class NotificationService:
     ) -> None:
         """Send email notification"""
         try:
-            # Format template with data
-            subject = template.subject.format(**data)
-            body = template.body.format(**data)
-            html_body = template.html_body.format(**data) if template.html_body else None
-            
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f"{self.from_name} <{self.from_email}>"
-            msg['To'] = recipient.email
-            msg['Subject'] = subject
-            
-            # Add text and HTML parts
-            text_part = MIMEText(body, 'plain')
-            msg.attach(text_part)
-            
-            if html_body:
-                html_part = MIMEText(html_body, 'html')
-                msg.attach(html_part)
+            msg = self._build_email(template, data, recipient.email)
             
             # Send email
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
@@ -233,6 +217,78 @@ class NotificationService:
             logger.error(f"Email sending failed: {e}")
             raise
     
+    def _build_email(self, template: NotificationTemplate, data: Dict[str, Any], to: str) -> MIMEMultipart:
+        """Render a template into an email message"""
+        # Format template with data
+        subject = template.subject.format(**data)
+        body = template.body.format(**data)
+        html_body = template.html_body.format(**data) if template.html_body else None
+        
+        # Create message
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f"{self.from_name} <{self.from_email}>"
+        msg['To'] = to
+        msg['Subject'] = subject
+        
+        # Add text and HTML parts
+        text_part = MIMEText(body, 'plain')
+        msg.attach(text_part)
+        
+        if html_body:
+            html_part = MIMEText(html_body, 'html')
+            msg.attach(html_part)
+        
+        return msg
+    
+    async def send_bulk(
+        self,
+        notification_type: NotificationType,
+        recipients: List[Dict[str, Any]],
+        data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send one email to many recipients in a single SMTP transaction"""
+        template = self.templates.get(notification_type)
+        if not template:
+            raise ValueError(f"No template found for notification type: {notification_type}")
+        
+        emails = [recipient["email"] for recipient in recipients if recipient.get("email")]
+        results = {
+            'success': [],
+            'failed': [],
+            'total_sent': 0,
+            'total_failed': 0
+        }
+        if not emails:
+            return results
+        
+        # Addresses only go in the envelope so recipients don't see each other
+        msg = self._build_email(template, data, f"{self.from_name} <{self.from_email}>")
+        
+        try:
+            refused, _ = await aiosmtplib.send(
+                msg,
+                recipients=emails,
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                start_tls=True,
+                username=self.smtp_username,
+                password=self.smtp_password
+            )
+        except Exception as e:
+            logger.error(f"Bulk email sending failed: {e}")
+            refused = {email: e for email in emails}
+        
+        for email in emails:
+            if email in refused:
+                results['failed'].append({'email': email, 'error': str(refused[email])})
+                results['total_failed'] += 1
+            else:
+                results['success'].append(email)
+                results['total_sent'] += 1
+        
+        logger.info(f"Bulk email sent to {results['total_sent']} of {len(emails)} recipients")
+        return results
+    
     async def _send_sms(self, recipient: NotificationRecipient, template: NotificationTemplate, data: Dict[str, Any]) -> None:
         """Send SMS notification (placeholder implementation)"""
         # In real implementation, integrate with SMS service like Twilio
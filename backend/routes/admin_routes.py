@@ -8,8 +8,7 @@ from models import (
     BatchYearUpdate, APIResponse, UserRole, Section, SectionsUpdate
 )
 from database import DatabaseOperations
-from auth import AuthService, AuthHelpers
-import bcrypt
+from auth import AuthService, AuthHelpers, ahash_password
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin", tags=["Admin Management"])
@@ -82,10 +81,7 @@ async def create_hod(
             )
         
         # Hash password
-        password_hash = bcrypt.hashpw(
-            hod_data.password.encode('utf-8'),
-            bcrypt.gensalt()
-        ).decode('utf-8')
+        password_hash = await ahash_password(hod_data.password)
         
         # Create HOD admin record
         hod_admin = Admin(
@@ -223,10 +219,7 @@ async def update_hod(
         }
         
         if hod_data.password:
-            password_hash = bcrypt.hashpw(
-                hod_data.password.encode('utf-8'),
-                bcrypt.gensalt()
-            ).decode('utf-8')
+            password_hash = await ahash_password(hod_data.password)
             update_data["password_hash"] = password_hash
         
         # Update HOD
@@ -235,6 +228,7 @@ async def update_hod(
             {"id": hod_id},
             update_data
         )
+        AuthService.invalidate_cached_user("admins", hod_id)
         
         # Update department HOD assignment if changed
         if hod_data.department != existing_hod.get("department"):
@@ -290,6 +284,7 @@ async def deactivate_hod(
         
         # Hard delete HOD
         delete_result = await DatabaseOperations.delete_by_id("admins", hod_id)
+        AuthService.invalidate_cached_user("admins", hod_id)
         
         logger.info(f"Delete result: {delete_result}")
         
@@ -369,6 +364,7 @@ async def assign_hod_to_department(
             hod_id,
             {"department": department_code.upper()}
         )
+        AuthService.invalidate_cached_user("admins", hod_id)
         
         # Update department's HOD
         await DatabaseOperations.update_one(
@@ -442,6 +438,7 @@ async def assign_department_to_hod(
             hod_id,
             {"department": department["code"]}
         )
+        AuthService.invalidate_cached_user("admins", hod_id)
         
         return APIResponse(
             success=True,
@@ -490,6 +487,7 @@ async def unassign_hod_from_department(
             hod_id,
             {"department": None}
         )
+        AuthService.invalidate_cached_user("admins", hod_id)
         
         # Update department's HOD
         if department:
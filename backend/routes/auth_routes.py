@@ -26,9 +26,7 @@ async def admin_login(credentials: AdminLogin):
             )
         
         # Create access and refresh tokens
-        access_token = AuthService.create_access_token(
-            data={"sub": admin.id, "role": admin.role}
-        )
+        access_token = AuthService.create_access_token_for(admin.id, admin.role)
         refresh_token = AuthService.create_refresh_token(
             data={"sub": admin.id, "role": admin.role}
         )
@@ -74,9 +72,7 @@ async def student_login(credentials: StudentLogin):
             )
         
         # Create access and refresh tokens
-        access_token = AuthService.create_access_token(
-            data={"sub": student.id, "role": "student"}
-        )
+        access_token = AuthService.create_access_token_for(student.id, "student")
         refresh_token = AuthService.create_refresh_token(
             data={"sub": student.id, "role": "student"}
         )
@@ -133,9 +129,7 @@ async def refresh_token(credentials: HTTPAuthorizationCredentials = Depends(secu
             )
         
         # Create new access token
-        new_access_token = AuthService.create_access_token(
-            data={"sub": user_id, "role": user_role}
-        )
+        new_access_token = AuthService.create_access_token_for(user_id, user_role)
         
         return APIResponse(
             success=True,
@@ -245,9 +239,7 @@ async def refresh_token(refresh_data: Dict[str, str]):
             )
         
         # Create new access token
-        new_access_token = AuthService.create_access_token(
-            data={"sub": user_id, "role": user_role}
-        )
+        new_access_token = AuthService.create_access_token_for(user_id, user_role)
         
         return APIResponse(
             success=True,
@@ -130,6 +130,7 @@ async def submit_feedback(
             'user_agent': 'hashed',  # In real implementation, hash the actual user agent
             'privacy_level': 'high',
             'consent_given': True,
+            'is_active': True,  # Counted by the dashboard, which skips deactivated submissions
             'data_retention_until': datetime.utcnow() + timedelta(days=2555)  # 7 years
         })
         
@@ -245,6 +245,7 @@ async def update_student(
             {"id": student_id},
             update_dict
         )
+        AuthService.invalidate_cached_user("students", student_id)
         
         if not updated:
             raise HTTPException(
@@ -275,6 +276,7 @@ async def delete_student(
     """Hard delete student (permanently remove from database)"""
     try:
         deleted = await DatabaseOperations.delete_by_id("students", student_id)
+        AuthService.invalidate_cached_user("students", student_id)
         
         if not deleted:
             raise HTTPException(
@@ -535,6 +537,8 @@ async def bulk_update_students(
             request.updates,
             validate_func=lambda item: []  # Add validation if needed
         )
+        for update in request.updates:
+            AuthService.invalidate_cached_user("students", update.get("id"))
         
         return APIResponse(
             success=result.success,
@@ -561,6 +565,8 @@ async def bulk_delete_students(
             request.ids,
             soft_delete=False
         )
+        for student_id in request.ids:
+            AuthService.invalidate_cached_user("students", student_id)
         
         return APIResponse(
             success=result.success,
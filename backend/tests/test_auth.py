@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 from unittest.mock import patch, Mock
 import jwt
 
-from auth import AuthService, hash_password, verify_password
+from auth import AuthService, hash_password, verify_password, password_needs_rehash, _hash_reset_token
 from conftest import TestHelpers, TestDataFactory
 
 
@@ -43,6 +43,20 @@ class TestPasswordHashing:
         invalid_hash = "invalid_hash"
         
         assert verify_password(password, invalid_hash) is False
+    
+    def test_verify_password_truncated_hash(self):
+        """Test password verification with a truncated hash."""
+        password = "TestPassword123!"
+        hashed = hash_password(password)
+        
+        assert verify_password(password, hashed[:-1]) is False
+        assert verify_password(password, "") is False
+    
+    def test_new_hash_does_not_need_rehash(self):
+        """Test that a freshly created hash uses the current scheme."""
+        hashed = hash_password("TestPassword123!")
+        
+        assert password_needs_rehash(hashed) is False
 
 
 class TestAuthService:
@@ -62,6 +76,16 @@ class TestAuthService:
         assert decoded["role"] == "admin"
         assert "exp" in decoded
     
+    def test_create_access_token_for(self):
+        """Test access token creation from a user id and role."""
+        token = AuthService.create_access_token_for("test-user", "admin")
+        
+        decoded = jwt.decode(token, "test-secret-key-for-testing-only", algorithms=["HS256"])
+        assert decoded["sub"] == "test-user"
+        assert decoded["role"] == "admin"
+        assert decoded["type"] == "access"
+        assert "exp" in decoded
+    
     def test_create_refresh_token(self):
         """Test refresh token creation."""
         data = {"sub": "test-user", "role": "admin"}
@@ -152,6 +176,8 @@ class TestAuthServiceAsync:
                 "email": admin_data["email"]
             })
             assert reset_token is not None
+            assert "token" not in reset_token
+            assert len(reset_token["token_hash"]) == 64
             assert reset_token["used"] is False
             assert reset_token["expires_at"] > datetime.utcnow()
             
@@ -188,7 +214,7 @@ class TestAuthServiceAsync:
         
         # Create reset token
         reset_token_data = {
-            "token": "test-reset-token",
+            "token_hash": _hash_reset_token("test-reset-token"),
             "user_id": admin_data["id"],
             "user_type": "admin",
             "email": admin_data["email"],
@@ -209,7 +235,7 @@ class TestAuthServiceAsync:
         
         # Check that reset token was marked as used
         used_token = await test_db.password_reset_tokens.find_one({
-            "token": "test-reset-token"
+            "token_hash": _hash_reset_token("test-reset-token")
         })
         assert used_token["used"] is True
         assert used_token["used_at"] is not None
@@ -223,7 +249,7 @@ class TestAuthServiceAsync:
         """Test password reset with expired token."""
         # Create expired reset token
         reset_token_data = {
-            "token": "expired-token",
+            "token_hash": _hash_reset_token("expired-token"),
             "user_id": "test-user",
             "user_type": "admin",
             "email": "test@example.com",
@@ -240,7 +266,7 @@ class TestAuthServiceAsync:
         """Test password reset with already used token."""
         # Create used reset token
         reset_token_data = {
-            "token": "used-token",
+            "token_hash": _hash_reset_token("used-token"),
             "user_id": "test-user",
             "user_type": "admin",
             "email": "test@example.com",
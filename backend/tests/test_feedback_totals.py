@@ -0,0 +1,108 @@
+"""
+Tests for the running feedback totals behind the dashboard summary
+"""
+import pytest
+import fakeredis
+
+import database
+from cache_service import cache_service
+from database import AnalyticsOperations, DatabaseOperations
+
+
+def make_submission(submission_id, department, *ratings, is_active=True):
+    """Build a feedback submission with one faculty entry per rating."""
+    return {
+        "id": submission_id,
+        "department": department,
+        "student_section": "A",
+        "faculty_feedbacks": [{"overall_rating": rating} for rating in ratings],
+        "is_active": is_active
+    }
+
+
+@pytest.fixture
+async def feedback_totals(test_db, monkeypatch):
+    """Point DatabaseOperations at the test database and the cache at a fake Redis."""
+    monkeypatch.setattr(database.Database, "database", test_db)
+    redis_client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr(cache_service, "redis_client", redis_client)
+    await test_db.feedback_submissions.delete_many({})
+    yield redis_client
+    await test_db.feedback_submissions.delete_many({})
+
+
+async def recount(department_filter=None):
+    """Dashboard totals computed from MongoDB alone."""
+    redis_client = cache_service.redis_client
+    cache_service.redis_client = None
+    try:
+        return await AnalyticsOperations.get_dashboard_summary(department_filter)
+    finally:
+        cache_service.redis_client = redis_client
+
+
+def totals(summary):
+    """The parts of the dashboard summary served from the counters."""
+    return summary["total_submissions"], summary["average_rating"]
+
+
+@pytest.mark.asyncio
+class TestFeedbackTotals:
+    """Test that the counters stay in step with the submissions."""
+    
+    async def test_insert_before_seeding_creates_no_counter(self, feedback_totals):
+        """Test that increments skip totals that haven't been seeded."""
+        await DatabaseOperations.insert_one("feedback_submissions", make_submission("f1", "CSE", 8))
+        
+        assert await feedback_totals.keys("counter:feedback:*") == []
+    
+    async def test_seeding_matches_recount(self, feedback_totals, test_db):
+        """Test that the first summary seeds totals with an expiry."""
+        await test_db.feedback_submissions.insert_many([
+            make_submission("f1", "CSE", 8, 6),
+            make_submission("f2", "ECE", 4),
+            make_submission("f3", "CSE", 9, is_active=False)
+        ])
+        
+        summary = await AnalyticsOperations.get_dashboard_summary({"department": "CSE"})
+        
+        assert totals(summary) == totals(await recount({"department": "CSE"})) == (1, 7.0)
+        assert 0 < await feedback_totals.ttl("counter:feedback:CSE") <= database._FEEDBACK_TOTALS_TTL
+        assert await feedback_totals.smembers(database._FEEDBACK_TOTALS_INDEX) == {b"counter:feedback:CSE"}
+    
+    async def test_seeding_keeps_existing_totals(self, feedback_totals):
+        """Test that seeding never overwrites totals another worker has seeded."""
+        await feedback_totals.hset("counter:feedback:all", mapping={"submissions": 5, "seeded": 1})
+        
+        seeded = await cache_service.seed_fields("counter:feedback:all", {"submissions": 1}, "seeded", 300)
+        
+        assert seeded is False
+        assert await feedback_totals.hget("counter:feedback:all", "submissions") == b"5"
+    
+    async def test_insert_updates_totals(self, feedback_totals, test_db):
+        """Test that inserts after seeding are counted without a recount."""
+        await test_db.feedback_submissions.insert_one(make_submission("f1", "CSE", 8, 6))
+        await AnalyticsOperations.get_dashboard_summary({})
+        
+        await DatabaseOperations.insert_one("feedback_submissions", make_submission("f2", "CSE", 10))
+        
+        assert await feedback_totals.hget("counter:feedback:all", "submissions") == b"2"
+        assert totals(await AnalyticsOperations.get_dashboard_summary({})) == totals(await recount()) == (2, 8.0)
+    
+    async def test_delete_drops_totals(self, feedback_totals, test_db):
+        """Test that soft and hard deletes leave no stale totals behind."""
+        await test_db.feedback_submissions.insert_many([
+            make_submission("f1", "CSE", 8),
+            make_submission("f2", "CSE", 6),
+            make_submission("f3", "ECE", 4)
+        ])
+        await AnalyticsOperations.get_dashboard_summary({})
+        
+        await DatabaseOperations.update_many("feedback_submissions", {"id": "f1"}, {"is_active": False})
+        
+        assert await feedback_totals.keys("counter:feedback:*") == []
+        assert totals(await AnalyticsOperations.get_dashboard_summary({})) == totals(await recount()) == (2, 5.0)
+        
+        await DatabaseOperations.delete_many("feedback_submissions", {"id": "f3"})
+        
+        assert totals(await AnalyticsOperations.get_dashboard_summary({})) == totals(await recount()) == (1, 6.0)
@@ -5,7 +5,7 @@ import logging
 from typing import Dict, Any, List, Optional, Callable, Awaitable
 from contextlib import asynccontextmanager
 from motor.motor_asyncio import AsyncIOMotorClient
-from database import get_database
+from database import get_database, DatabaseOperations
 
 logger = logging.getLogger(__name__)
 
@@ -122,8 +122,10 @@ class DatabaseIntegrityManager:
             # Create feedback
             result = await self.db.feedback_submissions.insert_one(feedback_data, session=session)
             feedback_data["id"] = str(result.inserted_id)
-            
-            return feedback_data
+        
+        # Counted only once the transaction has committed
+        await DatabaseOperations.track_inserted("feedback_submissions", [feedback_data])
+        return feedback_data
     
     async def cascade_delete_student(self, student_id: str) -> bool:
         """Cascade delete student and related data"""
@@ -153,8 +155,9 @@ class DatabaseIntegrityManager:
                 },
                 session=session
             )
-            
-            return True
+        
+        await DatabaseOperations.track_changed("feedback_submissions")
+        return True
     
     async def cascade_delete_faculty(self, faculty_id: str) -> bool:
         """Cascade delete faculty and related data"""
@@ -181,8 +184,9 @@ class DatabaseIntegrityManager:
                 },
                 session=session
             )
-            
-            return True
+        
+        await DatabaseOperations.track_changed("feedback_submissions")
+        return True
 
 # Global instances
 transaction_manager = TransactionManager()